@@ -23,12 +23,13 @@ import asyncio
 import sys
 import argparse
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.services.data_collection_service import DataCollectionService
+from src.services.data import DataCollectionService
 from loguru import logger
 
 # Configure logger
@@ -221,11 +222,11 @@ class DataCollectionCLI:
             sources[src] = sources.get(src, 0) + 1
         
         print(f"\n📂 KATEGORIEN:")
-        for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+        for cat, count in sorted(categories.items(), key=itemgetter(1), reverse=True):
             print(f"   📂 {cat}: {count} articles")
         
         print(f"\n📰 QUELLEN:")
-        for src, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+        for src, count in sorted(sources.items(), key=itemgetter(1), reverse=True):
             print(f"   📰 {src}: {count} articles")
         
         print(f"\n🎯 TOP 10 NEWS:")
@@ -321,28 +322,30 @@ EXAMPLES:
     cli = DataCollectionCLI()
     success = False
     
-    try:
-        if args.test:
-            success = await cli.run_service_tests()
-        elif args.news_only:
-            success = await cli.run_news_only(args.limit, args.max_age)
-        elif args.stats:
-            success = await cli.show_statistics()
-        else:
-            success = await cli.run_full_collection(args.preset, args.max_age)
+    # Geteilte Session wird beim Verlassen geschlossen (auch bei sys.exit)
+    async with cli.service:
+        try:
+            if args.test:
+                success = await cli.run_service_tests()
+            elif args.news_only:
+                success = await cli.run_news_only(args.limit, args.max_age)
+            elif args.stats:
+                success = await cli.show_statistics()
+            else:
+                success = await cli.run_full_collection(args.preset, args.max_age)
         
-        if success:
-            print(f"\n✅ Data Collection erfolgreich abgeschlossen!")
-        else:
-            print(f"\n❌ Data Collection fehlgeschlagen!")
-            sys.exit(1)
+            if success:
+                print(f"\n✅ Data Collection erfolgreich abgeschlossen!")
+            else:
+                print(f"\n❌ Data Collection fehlgeschlagen!")
+                sys.exit(1)
             
-    except KeyboardInterrupt:
-        print(f"\n⚠️ Data Collection abgebrochen!")
-        sys.exit(1)
-    except Exception as e:
-        logger.error(f"❌ Unerwarteter Fehler: {e}")
-        sys.exit(1)
+        except KeyboardInterrupt:
+            print(f"\n⚠️ Data Collection abgebrochen!")
+            sys.exit(1)
+        except Exception as e:
+            logger.error(f"❌ Unerwarteter Fehler: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -20,12 +20,19 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 from loguru import logger
 
+# uvloop (optional) - libuv-Event-Loop, Fallback auf asyncio-Standard (z.B. Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Import des Data Collection Service
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from services.data_collection_service import DataCollectionService
+from services.data import DataCollectionService
 
 
 class DataCollectionCLI:
@@ -243,31 +250,35 @@ async def main():
     # CLI initialisieren
     cli = DataCollectionCLI()
     
-    try:
-        # Verschiedene Modi
-        if args.test:
-            results = await cli.test_connections()
-            cli.display_test_results(results)
+    async with cli.service:
+        try:
+            # Verschiedene Modi
+            if args.test:
+                results = await cli.test_connections()
+                cli.display_test_results(results)
             
-        elif args.news_only:
-            data = await cli.run_news_only(args.max_age)
-            cli.display_results(data, args.format)
+            elif args.news_only:
+                data = await cli.run_news_only(args.max_age)
+                cli.display_results(data, args.format)
             
-        elif args.context_only:
-            data = await cli.run_context_only(args.location)
-            cli.display_results(data, args.format)
+            elif args.context_only:
+                data = await cli.run_context_only(args.location)
+                cli.display_results(data, args.format)
             
-        else:
-            # Full Collection (default)
-            data = await cli.run_full_collection(args.max_age)
-            cli.display_results(data, args.format)
+            else:
+                # Full Collection (default)
+                data = await cli.run_full_collection(args.max_age)
+                cli.display_results(data, args.format)
     
-    except KeyboardInterrupt:
-        print("\n⏹️  Abgebrochen durch Benutzer")
-    except Exception as e:
-        print(f"❌ Unerwarteter Fehler: {e}")
-        logger.error(f"CLI Main Fehler: {e}")
+        except KeyboardInterrupt:
+            print("\n⏹️  Abgebrochen durch Benutzer")
+        except Exception as e:
+            print(f"❌ Unerwarteter Fehler: {e}")
+            logger.error(f"CLI Main Fehler: {e}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
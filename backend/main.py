@@ -27,6 +27,13 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# uvloop (optional) - libuv-Event-Loop, Fallback auf asyncio-Standard (z.B. Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
 # Add src to path for clean imports
 sys.path.append(str(Path(__file__).parent / "src"))
 
@@ -606,7 +613,13 @@ ARCHITECTURE:
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Geteilte HTTP-Session der Datenquellen sauber schliessen
+        await master.data_collector.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    if UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main()) 
\ No newline at end of file
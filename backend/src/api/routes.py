@@ -1,5 +1,11 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse, JSONResponse
+
+from fastapi.responses import ORJSONResponse
+from services.data.json_codec import ORJSON_AVAILABLE
+
+# orjson (optional) - schnelleres Encoding der JSON-Antworten, sonst Standard-JSONResponse
+FastJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 import glob
@@ -79,7 +85,7 @@ async def get_latest_broadcast():
         # Dateigröße ermitteln
         file_size = os.path.getsize(latest_mp3)
         
-        return JSONResponse({
+        return FastJSONResponse({
             "success": True,
             "mp3_file": filename,
             "mp3_path": f"/api/audio/{filename}",
@@ -145,7 +151,7 @@ async def list_broadcasts():
                 "file_size": os.path.getsize(mp3_file)
             })
         
-        return JSONResponse({
+        return FastJSONResponse({
             "success": True,
             "broadcasts": broadcasts,
             "total": len(broadcasts)
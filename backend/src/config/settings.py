@@ -3,6 +3,7 @@ RadioX Settings - Konfiguration für alle Services
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from pydantic_settings import BaseSettings
@@ -23,6 +24,7 @@ class Settings(BaseSettings):
     elevenlabs_api_key: Optional[str] = None
     elevenlabs_marcel_voice_id: Optional[str] = None
     elevenlabs_jarvis_voice_id: Optional[str] = None
+    elevenlabs_max_concurrent: int = 3  # Parallele TTS-Requests (ElevenLabs Concurrency-Limit)
     
     # CoinMarketCap
     coinmarketcap_api_key: Optional[str] = None
@@ -61,31 +63,26 @@ class Settings(BaseSettings):
         extra = "ignore"  # Ignoriere unbekannte Felder
 
 
-# Global Settings Instance
-_settings: Optional[Settings] = None
+def _is_valid_key(value: Optional[str]) -> bool:
+    """Prüft ob ein API Key gültig ist (nicht None, nicht leer, nicht Template)"""
+    if not value:
+        return False
+    if value.startswith("your_") or value.endswith("_here"):
+        return False
+    return True
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
-    """Holt die globale Settings-Instanz"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-        
-        # Hilfsfunktion für Template-Wert-Erkennung
-        def is_valid_key(value: Optional[str]) -> bool:
-            """Prüft ob ein API Key gültig ist (nicht None, nicht leer, nicht Template)"""
-            if not value:
-                return False
-            if value.startswith("your_") or value.endswith("_here"):
-                return False
-            return True
-        
-        # Debug: Zeige geladene API Keys mit ASCII-Zeichen für Windows-Kompatibilität
-        print("Settings geladen:")
-        print(f"   OpenAI API Key: {'[OK]' if is_valid_key(_settings.openai_api_key) else '[FEHLT]'}")
-        print(f"   ElevenLabs API Key: {'[OK]' if is_valid_key(_settings.elevenlabs_api_key) else '[FEHLT]'}")
-        print(f"   CoinMarketCap API Key: {'[OK]' if is_valid_key(_settings.coinmarketcap_api_key) else '[FEHLT]'}")
-        print(f"   Weather API Key: {'[OK]' if is_valid_key(_settings.weather_api_key) else '[FEHLT]'}")
-        print(f"   Supabase URL: {'[OK]' if is_valid_key(_settings.supabase_url) else '[FEHLT]'}")
-        print(f"   Twitter Bearer: {'[OK]' if is_valid_key(_settings.twitter_bearer_token) else '[FEHLT]'}")
-    return _settings 
\ No newline at end of file
+    """Holt die globale Settings-Instanz (einmal erzeugt, danach gecacht)"""
+    settings = Settings()
+    
+    # Debug: Zeige geladene API Keys mit ASCII-Zeichen für Windows-Kompatibilität
+    print("Settings geladen:")
+    print(f"   OpenAI API Key: {'[OK]' if _is_valid_key(settings.openai_api_key) else '[FEHLT]'}")
+    print(f"   ElevenLabs API Key: {'[OK]' if _is_valid_key(settings.elevenlabs_api_key) else '[FEHLT]'}")
+    print(f"   CoinMarketCap API Key: {'[OK]' if _is_valid_key(settings.coinmarketcap_api_key) else '[FEHLT]'}")
+    print(f"   Weather API Key: {'[OK]' if _is_valid_key(settings.weather_api_key) else '[FEHLT]'}")
+    print(f"   Supabase URL: {'[OK]' if _is_valid_key(settings.supabase_url) else '[FEHLT]'}")
+    print(f"   Twitter Bearer: {'[OK]' if _is_valid_key(settings.twitter_bearer_token) else '[FEHLT]'}")
+    return settings
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+HTTP Session Pool
+=================
+
+Langlebige aiohttp.ClientSession für einen Upstream (z.B. ElevenLabs) mit
+Recycling und Invalidierung - neutral unter services/, damit Generation-
+und Data-Layer ihn nutzen können, ohne ein Paket-__init__ mitzuladen:
+
+- lease(): leiht die aktuelle Session aus (async with)
+- Nach max_session_duration wird für neue Leases eine frische Session gebaut;
+  die alte wird geschlossen, sobald ihr letzter Lease zurückgegeben ist
+- Verbindungsfehler (Timeout, Disconnect) innerhalb eines Leases verwerfen
+  die Session automatisch (invalidate), der nächste Lease baut neu auf
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Optional
+
+import aiohttp
+from loguru import logger
+
+
+class PooledSession:
+    """Eine Session pro Upstream, sicher recycelbar während Requests laufen"""
+
+    def __init__(
+        self,
+        factory: Callable[[], aiohttp.ClientSession],
+        max_session_duration: float = 300.0
+    ):
+        self._factory = factory
+        self.max_session_duration = max_session_duration
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._created_at = 0.0
+        self._lock = asyncio.Lock()
+
+        # Laufende Leases pro Session (alte Sessions erst schliessen, wenn frei)
+        self._leases: Dict[aiohttp.ClientSession, int] = {}
+        self._retired: set = set()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._session is not None
+            and not self._session.closed
+            and time.monotonic() - self._created_at < self.max_session_duration
+        )
+
+    async def _current(self) -> aiohttp.ClientSession:
+        if self._is_fresh():
+            return self._session
+
+        async with self._lock:
+            if not self._is_fresh():
+                if self._session is not None:
+                    await self._retire(self._session)
+                self._session = self._factory()
+                self._created_at = time.monotonic()
+        return self._session
+
+    async def _retire(self, session: aiohttp.ClientSession) -> None:
+        """Schliesst eine ersetzte Session sofort oder nach dem letzten Lease"""
+        if self._leases.get(session, 0) == 0:
+            self._leases.pop(session, None)
+            if not session.closed:
+                await session.close()
+        else:
+            self._retired.add(session)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Leiht die aktuelle Session für einen oder mehrere Requests aus"""
+
+        session = await self._current()
+        self._leases[session] = self._leases.get(session, 0) + 1
+        try:
+            yield session
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            await self.invalidate(session)
+            raise
+        finally:
+            remaining = self._leases.get(session, 1) - 1
+            if remaining > 0:
+                self._leases[session] = remaining
+            else:
+                self._leases.pop(session, None)
+                if session in self._retired:
+                    self._retired.discard(session)
+                    if not session.closed:
+                        await session.close()
+
+    async def invalidate(self, session: aiohttp.ClientSession) -> None:
+        """Verwirft session (z.B. nach Timeout); der nächste Lease baut neu auf"""
+
+        async with self._lock:
+            if session is self._session:
+                logger.debug("🔄 HTTP-Session verworfen - nächster Request baut neu auf")
+                self._session = None
+                await self._retire(session)
+
+    async def aclose(self) -> None:
+        """Schliesst alle Sessions (einmal beim Shutdown aufrufen)"""
+
+        async with self._lock:
+            sessions = set(self._retired)
+            if self._session is not None:
+                sessions.add(self._session)
+            self._session = None
+            self._retired.clear()
+            self._leases.clear()
+
+        for session in sessions:
+            if not session.closed:
+                await session.close()
@@ -11,10 +11,25 @@ Alle Services für Datensammlung und -akquisition:
 Best Practice: Domain-driven Design für Data Access Layer
 """
 
+from importlib import import_module
+
 from .data_collection_service import DataCollectionService
-from .rss_service import RSSService  
-from .bitcoin_service import BitcoinService
-from .weather_service import WeatherService
+
+# Quell-Services erst beim ersten Zugriff laden (PEP 562)
+_LAZY_SERVICES = {
+    "RSSService": ".rss_service",
+    "BitcoinService": ".bitcoin_service",
+    "WeatherService": ".weather_service"
+}
+
+
+def __getattr__(name):
+    module = _LAZY_SERVICES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "DataCollectionService",
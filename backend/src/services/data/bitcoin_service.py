@@ -11,19 +11,64 @@ Fallback-Daten wenn API nicht verfügbar.
 import asyncio
 import aiohttp
 import json
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from loguru import logger
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 import random
+import time
 
 # Load environment variables from ROOT directory
 load_dotenv(Path(__file__).parent.parent.parent.parent / '.env')
 
 # Import Settings
 from config.settings import get_settings
+from .http_session import TRANSIENT_ERRORS, UpstreamServerError, retry_transient
+from .json_codec import loads as _loads
+
+
+class CoinMarketCapServerError(UpstreamServerError):
+    """CoinMarketCap answered with a 5xx status"""
+
+
+# Dedicated RNG for fallback data (no shared global random state)
+_RNG = random.Random()
+
+# 24h trend classification: TREND_LEVELS[i] applies for BOUNDS[i-1] < change <= BOUNDS[i]
+TREND_BOUNDS = (-10, -5, -2, 2, 5, 10)
+TREND_LEVELS = (
+    ("crash", "💥", "Bitcoin CRASH! {change:.1f}% in 24h"),
+    ("bearish", "🔻", "Bitcoin bearish trend: {change:.1f}%"),
+    ("negative", "📉", "Bitcoin slightly negative: {change:.1f}%"),
+    ("stable", "➡️", "Bitcoin stable: {change:+.1f}%"),
+    ("positive", "📊", "Bitcoin slightly positive: +{change:.1f}%"),
+    ("bullish", "📈", "Bitcoin bullish trend! +{change:.1f}% in 24h"),
+    ("moon", "🚀", "Bitcoin TO THE MOON! +{change:.1f}% in 24h"),
+)
+
+# Radio trend words, same boundary semantics
+RADIO_TREND_BOUNDS = (-5, -2, 0, 2, 5)
+RADIO_TREND_WORDS = (
+    "dropped significantly", "is down", "is stable", "is up", "increased", "surged"
+)
+
+# Radio timeframes: timeframe -> (change key in bitcoin_data, spoken description)
+RADIO_TIMEFRAMES: Mapping[str, Tuple[str, str]] = MappingProxyType({
+    "1h": ("change_1h", "in the last hour"),
+    "24h": ("change_24h", "in the last 24 hours"),
+    "7d": ("change_7d", "in the last 7 days"),
+    "30d": ("change_30d", "in the last 30 days"),
+    "60d": ("change_60d", "in the last 60 days"),
+    "90d": ("change_90d", "in the last 90 days")
+})
+
+# Round-number price levels announced as "approaching" alerts
+PRICE_MILESTONES = (50000, 75000, 100000, 150000, 200000)
 
 
 class BitcoinService:
@@ -49,14 +94,70 @@ class BitcoinService:
             "default_currency": "USD",
             "timeout": 30,
             "cache_duration": 300,  # 5 minutes
-            "symbol": "BTC"  # Bitcoin only
+            "symbol": "BTC",  # Bitcoin only
+            "max_rpm": 30,  # CMC Basic plan limit
+            "default_retry_after": 60  # Cooldown if 429 has no Retry-After
+        }
+        
+        # Request constants (built once instead of per API call)
+        self._quote_url = f"{self.base_url}/cryptocurrency/quotes/latest"
+        self._quote_params = {
+            'symbol': self.config["symbol"],
+            'convert': self.config["default_currency"]
+        }
+        self._headers = {
+            'Accepts': 'application/json',
+            'X-CMC_PRO_API_KEY': self.api_key or '',
         }
         
+        # AIMD rate control: halve allowed RPM on 429, +0.5 per success
+        self._rpm_limit = float(self.config["max_rpm"])
+        self._next_allowed = 0.0
+        self._call_times: deque = deque()
+        
         # Cache for API responses
         self.cache = {
             "last_update": None,
             "bitcoin_data": None
         }
+        # Monotonic expiry for cheap validity checks (last_update only for reporting)
+        self._bitcoin_expiry = 0.0
+        
+        # Stale-while-revalidate: one refresh at a time, stale data served meanwhile
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        
+        # Persistent HTTP session (keep-alive + DNS cache across calls)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = True
+        self._session_lock = asyncio.Lock()
+        self._timeout = aiohttp.ClientTimeout(total=self.config["timeout"])
+    
+    def attach_session(self, session: aiohttp.ClientSession) -> None:
+        """Uses an externally managed session (e.g. from DataCollectionService)"""
+        self._session = session
+        self._owns_session = False
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Returns the shared HTTP session, creating it on first use"""
+        
+        if self._session is not None and not self._session.closed:
+            return self._session
+        
+        async with self._session_lock:
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(limit=10, keepalive_timeout=60, ttl_dns_cache=300)
+                self._session = aiohttp.ClientSession(connector=connector)
+                self._owns_session = True
+        return self._session
+    
+    async def close(self) -> None:
+        """Closes the HTTP session (attached sessions are left to their owner)"""
+        
+        if self._owns_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._owns_session = True
     
     async def get_bitcoin_price(self) -> Optional[Dict[str, Any]]:
         """
@@ -70,74 +171,121 @@ class BitcoinService:
         if self._is_cache_valid():
             return self.cache["bitcoin_data"]
         
+        # Stale but within grace window (2x TTL): serve immediately, refresh in background
+        if self._is_cache_stale_usable():
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_bitcoin())
+            return self.cache["bitcoin_data"]
+        
+        # Fully expired: wait for a fetch, but only one caller hits the API
+        async with self._refresh_lock:
+            if self._is_cache_valid():
+                return self.cache["bitcoin_data"]
+            return await self._fetch_bitcoin_price()
+    
+    async def _refresh_bitcoin(self) -> None:
+        """Background refresh for stale cache entries"""
+        
+        try:
+            async with self._refresh_lock:
+                if not self._is_cache_valid():
+                    await self._fetch_bitcoin_price()
+        except Exception as e:
+            logger.warning(f"⚠️ Bitcoin background refresh failed: {e}")
+    
+    async def _fetch_bitcoin_price(self) -> Optional[Dict[str, Any]]:
+        """Fetches the Bitcoin quote from CoinMarketCap and updates the cache"""
+        
         if not self.api_key:
             logger.warning("⚠️ CoinMarketCap API Key not available")
             return self._get_fallback_bitcoin_data()
         
-        # API Request Parameters
-        url = f"{self.base_url}/cryptocurrency/quotes/latest"
-        parameters = {
-            'symbol': 'BTC',
-            'convert': 'USD'
-        }
-        headers = {
-            'Accepts': 'application/json',
-            'X-CMC_PRO_API_KEY': self.api_key,
-        }
+        # Respect cooldown / sliding window; never stall collection longer than a request would
+        wait = self._rate_limit_delay()
+        if wait > self.config["timeout"]:
+            logger.warning(f"⚠️ CoinMarketCap cooldown active ({wait:.0f}s) - serving cached/fallback data")
+            return self.cache["bitcoin_data"] or self._get_fallback_bitcoin_data()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        
+        session = await self._get_session()
         
-        async with aiohttp.ClientSession() as session:
+        async def _request_quote():
+            self._call_times.append(time.monotonic())
             async with session.get(
-                url, 
-                headers=headers, 
-                params=parameters,
-                timeout=aiohttp.ClientTimeout(total=self.config["timeout"])
+                self._quote_url, headers=self._headers, params=self._quote_params, timeout=self._timeout
             ) as response:
+                if response.status >= 500:
+                    raise CoinMarketCapServerError(response.status)
+                body = await response.read() if response.status == 200 else b""
+                return response.status, response.headers.get('Retry-After'), body
+        
+        try:
+            status, retry_after_header, body = await retry_transient(_request_quote, "CoinMarketCap")
+        except TRANSIENT_ERRORS as e:
+            logger.error(f"❌ CoinMarketCap request failed after retries: {e!r}")
+            return self.cache["bitcoin_data"] or self._get_fallback_bitcoin_data()
+        
+        if status == 200:
+            data = _loads(body)
+            if 'data' in data and 'BTC' in data['data']:
+                btc_data = data['data']['BTC']
+                quote = btc_data['quote']['USD']
+                
+                bitcoin_data = {
+                    'symbol': 'BTC',
+                    'name': 'Bitcoin',
+                    'price_usd': round(quote['price'], 2),
+                    'change_1h': round(quote.get('percent_change_1h', 0), 2),
+                    'change_24h': round(quote['percent_change_24h'], 2),
+                    'change_7d': round(quote['percent_change_7d'], 2),
+                    'change_30d': round(quote.get('percent_change_30d', 0), 2),
+                    'change_60d': round(quote.get('percent_change_60d', 0), 2),
+                    'change_90d': round(quote.get('percent_change_90d', 0), 2),
+                    'market_cap': quote['market_cap'],
+                    'volume_24h': quote['volume_24h'],
+                    'last_updated': quote['last_updated'],
+                    'timestamp': datetime.now().isoformat()
+                }
                 
-                if response.status == 200:
-                    data = await response.json()
-                    if 'data' in data and 'BTC' in data['data']:
-                        btc_data = data['data']['BTC']
-                        quote = btc_data['quote']['USD']
-                        
-                        bitcoin_data = {
-                            'symbol': 'BTC',
-                            'name': 'Bitcoin',
-                            'price_usd': round(quote['price'], 2),
-                            'change_1h': round(quote.get('percent_change_1h', 0), 2),
-                            'change_24h': round(quote['percent_change_24h'], 2),
-                            'change_7d': round(quote['percent_change_7d'], 2),
-                            'change_30d': round(quote.get('percent_change_30d', 0), 2),
-                            'change_60d': round(quote.get('percent_change_60d', 0), 2),
-                            'change_90d': round(quote.get('percent_change_90d', 0), 2),
-                            'market_cap': quote['market_cap'],
-                            'volume_24h': quote['volume_24h'],
-                            'last_updated': quote['last_updated'],
-                            'timestamp': datetime.now().isoformat()
-                        }
-                        
-                        # Update cache
-                        self.cache["bitcoin_data"] = bitcoin_data
-                        self.cache["last_update"] = datetime.now()
-                        
-                        return bitcoin_data
+                # Update cache
+                self.cache["bitcoin_data"] = bitcoin_data
+                self.cache["last_update"] = datetime.now()
+                self._bitcoin_expiry = time.monotonic() + self.config["cache_duration"]
                 
-                elif response.status == 429:
-                    logger.warning("⚠️ CoinMarketCap rate limit reached")
-                    return self._get_fallback_bitcoin_data()
+                # Additive increase
+                self._rpm_limit = min(float(self.config["max_rpm"]), self._rpm_limit + 0.5)
                 
-                else:
-                    logger.error(f"❌ CoinMarketCap API error {response.status}")
-                    return self._get_fallback_bitcoin_data()
+                return bitcoin_data
+        
+        elif status == 429:
+            # Multiplicative decrease + cooldown from Retry-After
+            retry_after = self._parse_retry_after(retry_after_header)
+            self._next_allowed = time.monotonic() + retry_after
+            self._rpm_limit = max(1.0, self._rpm_limit * 0.5)
+            logger.warning(
+                f"⚠️ CoinMarketCap rate limit reached - cooldown {retry_after:.0f}s, "
+                f"limit now {self._rpm_limit:.1f} rpm"
+            )
+            return self.cache["bitcoin_data"] or self._get_fallback_bitcoin_data()
+        
+        else:
+            logger.error(f"❌ CoinMarketCap API error {status}")
+            return self._get_fallback_bitcoin_data()
     
-    async def get_bitcoin_trend(self) -> Dict[str, Any]:
+    async def get_bitcoin_trend(self, bitcoin_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Analyzes Bitcoin trend based on price changes
         
+        Args:
+            bitcoin_data: Already fetched price data (fetched if omitted)
+        
         Returns:
             Dict with trend analysis
         """
         
-        bitcoin_data = await self.get_bitcoin_price()
+        if bitcoin_data is None:
+            bitcoin_data = await self.get_bitcoin_price()
         
         if not bitcoin_data:
             return {"trend": "unknown", "message": "No Bitcoin data available"}
@@ -145,35 +293,9 @@ class BitcoinService:
         change_24h = bitcoin_data.get('change_24h', 0)
         price = bitcoin_data.get('price_usd', 0)
         
-        # Trend Analysis
-        if change_24h > 10:
-            trend = "moon"
-            emoji = "🚀"
-            message = f"Bitcoin TO THE MOON! +{change_24h:.1f}% in 24h"
-        elif change_24h > 5:
-            trend = "bullish"
-            emoji = "📈"
-            message = f"Bitcoin bullish trend! +{change_24h:.1f}% in 24h"
-        elif change_24h > 2:
-            trend = "positive"
-            emoji = "📊"
-            message = f"Bitcoin slightly positive: +{change_24h:.1f}%"
-        elif change_24h > -2:
-            trend = "stable"
-            emoji = "➡️"
-            message = f"Bitcoin stable: {change_24h:+.1f}%"
-        elif change_24h > -5:
-            trend = "negative"
-            emoji = "📉"
-            message = f"Bitcoin slightly negative: {change_24h:.1f}%"
-        elif change_24h > -10:
-            trend = "bearish"
-            emoji = "🔻"
-            message = f"Bitcoin bearish trend: {change_24h:.1f}%"
-        else:
-            trend = "crash"
-            emoji = "💥"
-            message = f"Bitcoin CRASH! {change_24h:.1f}% in 24h"
+        # Trend Analysis (lookup table; bisect_left keeps the strict ">" boundaries)
+        trend, emoji, template = TREND_LEVELS[bisect_left(TREND_BOUNDS, change_24h)]
+        message = template.format(change=change_24h)
         
         return {
             "trend": trend,
@@ -184,12 +306,17 @@ class BitcoinService:
             "formatted": f"{emoji} ${price:,.0f} ({change_24h:+.1f}%)"
         }
     
-    async def get_bitcoin_alerts(self, price_threshold: float = 100000) -> List[Dict[str, Any]]:
+    async def get_bitcoin_alerts(
+        self,
+        price_threshold: float = 100000,
+        bitcoin_data: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Checks Bitcoin price alerts
         
         Args:
             price_threshold: Price threshold in USD
+            bitcoin_data: Already fetched price data (fetched if omitted)
             
         Returns:
             List of triggered alerts
@@ -198,7 +325,8 @@ class BitcoinService:
         alerts = []
         
         try:
-            bitcoin_data = await self.get_bitcoin_price()
+            if bitcoin_data is None:
+                bitcoin_data = await self.get_bitcoin_price()
             
             if not bitcoin_data:
                 return alerts
@@ -224,9 +352,8 @@ class BitcoinService:
                     "price": price
                 })
             
-            # Milestone Alerts
-            milestones = [50000, 75000, 100000, 150000, 200000]
-            for milestone in milestones:
+            # Milestone Alerts (milestones are >2k apart, so at most one can match)
+            for milestone in PRICE_MILESTONES:
                 if abs(price - milestone) < 1000:  # Within 1k of milestone
                     alerts.append({
                         "type": "milestone_approach",
@@ -234,6 +361,7 @@ class BitcoinService:
                         "price": price,
                         "milestone": milestone
                     })
+                    break
             
             return alerts
             
@@ -252,6 +380,32 @@ class BitcoinService:
             logger.error(f"Bitcoin Service test error: {e}")
             return False
     
+    async def ping(self) -> bool:
+        """
+        Cheap liveness check via the free /key/info endpoint
+        
+        Returns:
+            True if the API key is accepted (or fresh cached data exists)
+        """
+        
+        if self._is_cache_valid():
+            return True
+        
+        if not self.api_key:
+            logger.warning("⚠️ CoinMarketCap API Key not available")
+            return False
+        
+        try:
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/key/info", headers=self._headers, timeout=self._timeout
+            ) as response:
+                return response.status == 200
+                
+        except Exception as e:
+            logger.error(f"Bitcoin Service ping error: {e}")
+            return False
+    
     # Private Methods
     
     def _get_fallback_bitcoin_data(self) -> Dict[str, Any]:
@@ -259,16 +413,16 @@ class BitcoinService:
         
         # Simulate realistic Bitcoin data
         base_price = 105000  # Base price
-        price_variation = random.uniform(-0.05, 0.05)  # ±5% variation
+        price_variation = _RNG.uniform(-0.05, 0.05)  # ±5% variation
         current_price = base_price * (1 + price_variation)
         
-        change_24h = random.uniform(-8.0, 8.0)  # ±8% daily change
+        change_24h = _RNG.uniform(-8.0, 8.0)  # ±8% daily change
         
         return {
             "symbol": "BTC",
             "name": "Bitcoin",
             "price_usd": round(current_price, 2),
-            "change_1h": round(random.uniform(-2.0, 2.0), 2),  # ±2% hourly change
+            "change_1h": round(_RNG.uniform(-2.0, 2.0), 2),  # ±2% hourly change
             "change_24h": round(change_24h, 2),
             "change_7d": round(change_24h * 0.7, 2),
             "change_30d": round(change_24h * 2.5, 2),  # Monthly trend
@@ -281,14 +435,41 @@ class BitcoinService:
             "fallback_mode": True
         }
     
+    def _rate_limit_delay(self) -> float:
+        """Seconds to wait before the next CMC request is allowed"""
+        
+        now = time.monotonic()
+        
+        # Drop calls older than the 60s window
+        while self._call_times and now - self._call_times[0] >= 60:
+            self._call_times.popleft()
+        
+        delay = self._next_allowed - now
+        if len(self._call_times) >= int(self._rpm_limit):
+            delay = max(delay, self._call_times[0] + 60 - now)
+        
+        return max(0.0, delay)
+    
+    def _parse_retry_after(self, value: Optional[str]) -> float:
+        """Parses a Retry-After header (seconds), falling back to the default cooldown"""
+        
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return float(self.config["default_retry_after"])
+    
     def _is_cache_valid(self) -> bool:
         """Checks if cache is still valid"""
         
-        if not self.cache["last_update"] or not self.cache["bitcoin_data"]:
-            return False
+        return self.cache["bitcoin_data"] is not None and time.monotonic() < self._bitcoin_expiry
+    
+    def _is_cache_stale_usable(self) -> bool:
+        """Checks if expired cache data is still within the stale grace window"""
         
-        cache_age = (datetime.now() - self.cache["last_update"]).total_seconds()
-        return cache_age < self.config["cache_duration"]
+        return (
+            self.cache["bitcoin_data"] is not None
+            and time.monotonic() < self._bitcoin_expiry + self.config["cache_duration"]
+        )
     
     # Utility Methods
     
@@ -311,6 +492,7 @@ class BitcoinService:
             "last_update": None,
             "bitcoin_data": None
         }
+        self._bitcoin_expiry = 0.0
     
     def format_for_radio(self, bitcoin_data: Optional[Dict[str, Any]] = None, timeframe: str = "24h") -> str:
         """Formats Bitcoin data for radio announcement
@@ -325,34 +507,11 @@ class BitcoinService:
         
         price = bitcoin_data.get('price_usd', 0)
         
-        # Get change for specified timeframe
-        timeframe_map = {
-            "1h": ("change_1h", "in the last hour"),
-            "24h": ("change_24h", "in the last 24 hours"),
-            "7d": ("change_7d", "in the last 7 days"),
-            "30d": ("change_30d", "in the last 30 days"),
-            "60d": ("change_60d", "in the last 60 days"),
-            "90d": ("change_90d", "in the last 90 days")
-        }
-        
-        if timeframe not in timeframe_map:
-            timeframe = "24h"  # Default fallback
-        
-        change_key, time_description = timeframe_map[timeframe]
+        # Get change for specified timeframe (unknown -> 24h)
+        change_key, time_description = RADIO_TIMEFRAMES.get(timeframe, RADIO_TIMEFRAMES["24h"])
         change = bitcoin_data.get(change_key, 0)
         
         # Trend word
-        if change > 5:
-            trend_word = "surged"
-        elif change > 2:
-            trend_word = "increased"
-        elif change > 0:
-            trend_word = "is up"
-        elif change > -2:
-            trend_word = "is stable"
-        elif change > -5:
-            trend_word = "is down"
-        else:
-            trend_word = "dropped significantly"
+        trend_word = RADIO_TREND_WORDS[bisect_left(RADIO_TREND_BOUNDS, change)]
         
         return f"Bitcoin is trading at {price:,.0f} dollars and {trend_word} by {abs(change):.1f} percent {time_description}." 
\ No newline at end of file
@@ -13,14 +13,51 @@ Keine Intelligenz, keine Presets, keine Filterung!
 """
 
 import asyncio
+import aiohttp
+import json
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from functools import cached_property
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from loguru import logger
 import os
+import time
 
-from .rss_service import RSSService
-from .weather_service import WeatherService
-from .bitcoin_service import BitcoinService
+from .http_session import create_shared_session
+from .json_codec import dumps
+
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """
+    Circuit Breaker pro Datenquelle (closed -> open -> half-open)
+    
+    Nach `threshold` Fehlern in Folge wird die Quelle für `cooldown` Sekunden
+    übersprungen. Danach darf EIN Versuch durch (half-open): Erfolg schliesst
+    den Breaker, Fehler öffnet ihn erneut.
+    """
+    threshold: int = 5
+    cooldown: float = 30.0
+    failures: int = 0
+    opened_at: float = 0.0
+    
+    def allow(self) -> bool:
+        if self.failures < self.threshold:
+            return True
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            # half-open: ein Probe-Versuch, bis dahin wieder offen
+            self.opened_at = time.monotonic()
+            return True
+        return False
+    
+    def record(self, ok: bool) -> None:
+        if ok:
+            self.failures = 0
+            return
+        self.failures += 1
+        if self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
 
 
 class DataCollectionService:
@@ -31,12 +68,218 @@ class DataCollectionService:
     - RSS: get_all_recent_news()
     - Weather: get_current_weather()
     - Bitcoin: get_bitcoin_price()
+    
+    Rein I/O-gebunden: die Einstiegspunkte (main.py, CLI) laufen mit uvloop,
+    falls installiert.
     """
     
+    # Services werden erst beim ersten Zugriff importiert und erstellt
+    # (feedparser, Supabase-Client etc. nur laden, wenn die Quelle gebraucht wird)
+    _SERVICE_ATTRS = ("rss_service", "weather_service", "crypto_service")
+    
     def __init__(self):
-        self.rss_service = RSSService()
-        self.weather_service = WeatherService()
-        self.crypto_service = BitcoinService()
+        # EINE Session (ein Connection-Pool + DNS-Cache) für alle Datenquellen
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Laufende Abfragen pro Schlüssel (gleichzeitige Aufrufer teilen sich ein Ergebnis)
+        self._inflight: Dict[str, asyncio.Future] = {}
+        
+        # TTL-Cache für Wetter-Daten: Schlüssel -> (monotonic Zeitpunkt, Wert)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # Circuit Breaker pro Cache-Schlüssel (Quelle)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        
+        # Konfiguration
+        self.config = {
+            "weather_ttl": 300,  # Wetterbeobachtungen gelten ~5 Minuten
+            "timeout_seconds": 45,  # Harte Obergrenze pro Kontext-Quelle (News: pro Feed, siehe rss_service)
+            "breaker_threshold": 5,  # Fehler in Folge bis der Breaker öffnet
+            "breaker_cooldown": 30   # Sekunden bis zum nächsten Probe-Versuch
+        }
+    
+    @cached_property
+    def rss_service(self):
+        from .rss_service import RSSService
+        return self._attach(RSSService())
+    
+    @cached_property
+    def weather_service(self):
+        from .weather_service import WeatherService
+        return self._attach(WeatherService())
+    
+    @cached_property
+    def crypto_service(self):
+        from .bitcoin_service import BitcoinService
+        return self._attach(BitcoinService())
+    
+    def _attach(self, service):
+        """Hängt die geteilte Session an einen neu erstellten Service"""
+        if self._session is not None and not self._session.closed:
+            service.attach_session(self._session)
+        return service
+    
+    def _loaded_services(self) -> List[Any]:
+        """Bereits erstellte Services (ohne neue zu importieren)"""
+        return [self.__dict__[name] for name in self._SERVICE_ATTRS if name in self.__dict__]
+    
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Erstellt die geteilte Session bei Bedarf und hängt sie an alle Services"""
+        
+        if self._session is None or self._session.closed:
+            self._session = create_shared_session()
+            for service in self._loaded_services():
+                service.attach_session(self._session)
+        return self._session
+    
+    async def _dedup(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Führt coro_factory() nur einmal pro Schlüssel gleichzeitig aus
+        
+        Weitere Aufrufer mit gleichem Schlüssel warten auf dasselbe Future.
+        shield() verhindert, dass ein abgebrochener Aufrufer die Abfrage
+        für alle anderen abbricht.
+        """
+        
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = future
+            
+            def _forget(done: asyncio.Future, key: str = key) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+            
+            future.add_done_callback(_forget)
+        
+        return await asyncio.shield(future)
+    
+    async def _guarded(
+        self,
+        label: str,
+        awaitable: Awaitable[Any],
+        bounded: bool = True
+    ) -> Any:
+        """
+        Wartet höchstens timeout_seconds auf eine Datenquelle
+        
+        Gibt bei Timeout oder Fehler die Exception zurück statt sie zu werfen
+        (wie gather(return_exceptions=True)), damit eine fehlerhafte Quelle
+        die anderen in stream_all_data nicht abbricht. Die Abfrage selbst
+        läuft nach einem Timeout weiter (_dedup schirmt sie ab) und meldet
+        ihr Ergebnis dem Circuit Breaker.
+        
+        bounded=False: kein Gesamt-Timeout (für News - jeder Feed hat sein
+        eigenes Request-Timeout, ein Gesamt-Timeout würde bei vielen Feeds
+        alle bereits geladenen Artikel verwerfen).
+        """
+        
+        timeout = self.config["timeout_seconds"] if bounded else None
+        try:
+            return await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError as e:
+            logger.warning(f"⏱️ {label}: Timeout nach {self.config['timeout_seconds']}s")
+            return e
+        except Exception as e:
+            logger.error(f"❌ {label}: {e}")
+            return e
+    
+    def _source(self, source: str, max_age_hours: int = 12) -> Awaitable[Any]:
+        """
+        Einzige Stelle für Cache-Schlüssel, TTL und Timeout jeder Datenquelle
+        
+        Liefert ein Awaitable, das nie wirft (Fehler kommen als Exception-Objekt
+        zurück, siehe _guarded).
+        """
+        
+        if source == "news":
+            return self._guarded("News", self._dedup(
+                f"news:{max_age_hours}", lambda: self._collect_all_news_safe(max_age_hours)
+            ), bounded=False)
+        if source == "weather":
+            return self._guarded("Weather", self._cached(
+                "weather:zurich", self.config["weather_ttl"], self._collect_weather_safe, self._weather_ok
+            ))
+        if source == "crypto":
+            # Kein eigener Cache: BitcoinService cached den Kurs selbst
+            # (TTL + stale-while-revalidate) und ist dafür massgebend
+            return self._guarded("Crypto", self._dedup("crypto:btc", self._collect_crypto_safe))
+        raise ValueError(f"Unbekannte Datenquelle: {source}")
+    
+    @staticmethod
+    def _weather_ok(value: Any) -> bool:
+        """Wetter gilt nur mit aktuellen Messwerten als Erfolg"""
+        return bool(value) and value.get("current") is not None
+    
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Any]],
+        is_ok: Callable[[Any], bool] = bool
+    ) -> Any:
+        """
+        Liefert ein Ergebnis aus dem TTL-Cache oder holt es (dedupliziert) neu
+        
+        Gecacht wird nur, was is_ok() besteht - die *_safe Methoden liefern
+        auch im Fehlerfall ein gefülltes Dict (z.B. current=None oder
+        Fallback-Daten). Nicht bestandene Ergebnisse zählen als Fehler für
+        den Circuit Breaker. Ist dieser offen, wird ohne Upstream-Call der
+        letzte (ggf. abgelaufene) Wert geliefert - oder None, wenn es noch
+        keinen gibt (Quelle gilt dann im Ergebnis als fehlgeschlagen).
+        """
+        
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                threshold=self.config["breaker_threshold"],
+                cooldown=self.config["breaker_cooldown"]
+            )
+        
+        if not breaker.allow():
+            logger.warning(f"🚫 {key}: Circuit Breaker offen - überspringe Upstream")
+            return hit[1] if hit is not None else None
+        
+        async def _fetch() -> Any:
+            # Läuft EINMAL pro Upstream-Abfrage (_dedup): Breaker und Cache
+            # sehen jedes Ergebnis genau einmal, egal wie viele Aufrufer warten
+            try:
+                value = await coro_factory()
+            except Exception:
+                breaker.record(False)
+                raise
+            
+            ok = is_ok(value)
+            breaker.record(ok)
+            if ok:
+                self._cache[key] = (time.monotonic(), value)
+            return value
+        
+        value = await self._dedup(key, _fetch)
+        if not is_ok(value) and hit is not None:
+            # Stale-on-error: lieber alte Daten als keine
+            return hit[1]
+        return value
+    
+    async def aclose(self) -> None:
+        """Schliesst die geteilte Session (einmal beim Shutdown aufrufen)"""
+        
+        if "crypto_service" in self.__dict__:
+            await self.crypto_service.close()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self) -> "DataCollectionService":
+        self._ensure_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
     
     async def collect_all_data(self, max_age_hours: int = 12) -> Dict[str, Any]:
         """
@@ -45,24 +288,24 @@ class DataCollectionService:
         """
         
         logger.info("🚀 Starte vollständige Datensammlung...")
+        self._ensure_session()
+        
+        # Ein Wall-Clock-Zeitstempel pro Sammlung, Dauer über monotonic
+        started_at = datetime.now()
+        started = time.monotonic()
         
         # SEQUENZIELLE Sammlung um Race Conditions zu vermeiden
         logger.info("📰 Sammle News...")
-        news = await self._collect_all_news_safe(max_age_hours)
+        news = await self._source("news", max_age_hours)
         
         # Parallele Sammlung für Weather + Crypto (diese haben keine Konflikte)
         logger.info("🌍 Sammle Kontext-Daten parallel...")
-        weather_task = self._collect_weather_safe()
-        crypto_task = self._collect_crypto_safe()
-        
-        weather, crypto = await asyncio.gather(
-            weather_task, crypto_task,
-            return_exceptions=True
-        )
+        collected = {source: data async for source, data in self.stream_all_data(sources=("weather", "crypto"))}
+        weather, crypto = collected["weather"], collected["crypto"]
         
         # Ergebnisse zusammenfassen
         result = {
-            "collection_timestamp": datetime.now().isoformat(),
+            "collection_timestamp": started_at.isoformat(),
             "max_age_hours": max_age_hours,
             "news": news if not isinstance(news, Exception) else [],
             "weather": weather if not isinstance(weather, Exception) else None,
@@ -81,7 +324,8 @@ class DataCollectionService:
         
         # Statistiken
         news_count = len(result["news"]) if result["news"] else 0
-        logger.info(f"✅ Datensammlung abgeschlossen: {news_count} News, Wetter: {'✓' if result['weather'] else '✗'}, Bitcoin: {'✓' if result['crypto'] else '✗'}")
+        duration = time.monotonic() - started
+        logger.info(f"✅ Datensammlung abgeschlossen in {duration:.1f}s: {news_count} News, Wetter: {'✓' if result['weather'] else '✗'}, Bitcoin: {'✓' if result['crypto'] else '✗'}")
         
         # 🎨 HTML-Dashboards automatisch generieren
         try:
@@ -93,14 +337,45 @@ class DataCollectionService:
         
         return result
     
+    async def stream_all_data(
+        self,
+        max_age_hours: int = 12,
+        sources: Tuple[str, ...] = ("news", "weather", "crypto")
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Liefert (quelle, daten) für jede Quelle, sobald sie fertig ist
+        
+        Basis für collect_all_data/collect_context_data; Konsumenten können
+        z.B. den Wetter-Satz bauen, während die News noch geparst werden.
+        Fehler/Timeouts kommen als Exception-Objekt zurück. Bricht der
+        Konsument ab, werden offene Abfragen abgebrochen.
+        """
+        
+        self._ensure_session()
+        
+        async def _labelled(source: str) -> Tuple[str, Any]:
+            return source, await self._source(source, max_age_hours)
+        
+        tasks = [asyncio.create_task(_labelled(source)) for source in sources]
+        
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
     async def collect_news_only(self, max_age_hours: int = 12) -> Dict[str, Any]:
         """
         Sammelt nur RSS News - ALLE verfügbaren
         """
         
         logger.info("📰 Sammle ALLE RSS News...")
+        self._ensure_session()
         
-        news = await self._collect_all_news_safe(max_age_hours)
+        news = await self._source("news", max_age_hours)
+        if isinstance(news, Exception):
+            news = []
         
         return {
             "news": news,
@@ -113,14 +388,11 @@ class DataCollectionService:
         """Sammelt nur Kontext-Daten (ALLE Weather + Crypto)"""
         
         logger.info("🌍 Sammle ALLE Kontext-Daten...")
+        self._ensure_session()
         
         # Parallele Sammlung
-        weather_task = self._collect_weather_safe()
-        crypto_task = self._collect_crypto_safe()
-        
-        weather, crypto = await asyncio.gather(
-            weather_task, crypto_task, return_exceptions=True
-        )
+        collected = {source: data async for source, data in self.stream_all_data(sources=("weather", "crypto"))}
+        weather, crypto = collected["weather"], collected["crypto"]
         
         return {
             "weather": weather if not isinstance(weather, Exception) else None,
@@ -132,32 +404,34 @@ class DataCollectionService:
         """Testet alle Datenquellen-Verbindungen"""
         
         logger.info("🔧 Teste alle Datenquellen...")
+        self._ensure_session()
         
-        results = {}
-        
-        # Test RSS Feeds
-        try:
+        async def _probe_rss() -> bool:
             test_feeds = await self.rss_service.get_all_active_feeds()
-            results["rss_service"] = len(test_feeds) > 0
-        except Exception as e:
-            logger.error(f"RSS Test Fehler: {e}")
-            results["rss_service"] = False
+            return len(test_feeds) > 0
         
-        # Test Weather Service
-        try:
+        async def _probe_weather() -> bool:
             weather = await self.weather_service.get_current_weather("Zürich")
-            results["weather_service"] = weather is not None
-        except Exception as e:
-            logger.error(f"Weather Test Fehler: {e}")
-            results["weather_service"] = False
+            return weather is not None
         
-        # Test Crypto Service
-        try:
-            crypto = await self.crypto_service.get_bitcoin_price()
-            results["crypto_service"] = crypto is not None
-        except Exception as e:
-            logger.error(f"Crypto Test Fehler: {e}")
-            results["crypto_service"] = False
+        async def _probe_crypto() -> bool:
+            # /key/info statt Quote-Abfrage - kostet keine API-Credits
+            return await self.crypto_service.ping()
+        
+        # Alle Proben parallel - Gesamtdauer ~ langsamste Quelle statt Summe
+        names = ("rss_service", "weather_service", "crypto_service")
+        outcomes = await asyncio.gather(
+            _probe_rss(), _probe_weather(), _probe_crypto(),
+            return_exceptions=True
+        )
+        
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"{name} Test Fehler: {outcome}")
+                results[name] = False
+            else:
+                results[name] = bool(outcome)
         
         logger.info(f"🔧 Verbindungstests abgeschlossen: {results}")
         return results
@@ -325,10 +599,8 @@ class DataCollectionService:
     async def _generate_data_collection_dashboard(self, data: Dict[str, Any], outplay_dir: str):
         """Generiert das Data Collection Dashboard mit eingebetteten Daten"""
         
-        import json
-        
         # JSON-Daten direkt in JavaScript einbetten
-        json_data = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+        json_data = self.to_json(data, indent=True).decode('utf-8')
         
         # Data Collection HTML Template mit eingebetteten Daten
         data_collection_html = f"""<!DOCTYPE html>
@@ -653,15 +925,23 @@ class DataCollectionService:
         
         logger.info("✅ Data Collection Dashboard (data_collection.html) generiert")
     
+    def to_json(self, data: Dict[str, Any], indent: bool = False) -> bytes:
+        """
+        Serialisiert gesammelte Daten als UTF-8 JSON-Bytes
+        
+        Nutzt orjson falls verfügbar; unbekannte Typen (z.B. datetime) werden
+        in beiden Fällen per str() serialisiert (siehe json_codec.dumps).
+        """
+        
+        return dumps(data, indent=indent, default=str)
+    
     async def _save_json_data(self, data: Dict[str, Any], outplay_dir: str):
         """Speichert die JSON-Daten für JavaScript"""
         
-        import json
-        
         # Saubere JSON-Daten speichern
         json_path = os.path.join(outplay_dir, "data_collection_clean.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        with open(json_path, 'wb') as f:
+            f.write(self.to_json(data, indent=True))
         
         logger.info("✅ JSON-Daten gespeichert (data_collection_clean.json)")
     
@@ -670,7 +950,7 @@ class DataCollectionService:
         
         stats_html = '<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(150px, 1fr)); gap: 15px;">'
         
-        for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True):
+        for source, count in sorted(sources.items(), key=itemgetter(1), reverse=True):
             stats_html += f'''
                 <div style="background: #ecf0f1; padding: 15px; border-radius: 8px; text-align: center;">
                     <div class="source-badge source-{source}" style="display: inline-block; margin-bottom: 8px;">{source}</div>
@@ -716,12 +996,12 @@ class DataCollectionService:
         
         try:
             # DEBUG: Teste RSS Service direkt
-            logger.info(f"🔧 DEBUG: Teste RSS Service mit max_age_hours={max_age_hours}")
+            logger.info("🔧 DEBUG: Teste RSS Service mit max_age_hours={}", max_age_hours)
             
             # Einfach die rohen RSS News Items holen
             news_items = await self.rss_service.get_all_recent_news(max_age_hours)
             
-            logger.info(f"🔧 DEBUG: RSS Service returned {len(news_items) if news_items else 0} items")
+            logger.info("🔧 DEBUG: RSS Service returned {} items", len(news_items) if news_items else 0)
             
             if not news_items:
                 logger.warning("⚠️ Keine News gefunden")
@@ -747,28 +1027,15 @@ class DataCollectionService:
                 
                 return []
             
+            # Gleiche Meldung aus mehreren Feeds nur einmal weitergeben
+            news_items = self._dedupe_news_items(news_items)
+            
             # Konvertiere RSSNewsItem Objekte zu vollständigen JSON-Dictionaries
-            news_json = []
-            for item in news_items:
-                news_dict = {
-                    "title": item.title,
-                    "summary": item.summary,
-                    "link": item.link,  # WICHTIG: URL für GPT
-                    "published": item.published.isoformat(),
-                    "source": item.source,
-                    "category": item.category,
-                    "priority": item.priority,
-                    "weight": item.weight,
-                    # Zusätzliche Metadaten für GPT
-                    "published_timestamp": item.published.timestamp(),
-                    "age_hours": (datetime.now() - item.published).total_seconds() / 3600,
-                    "content_length": len(item.summary),
-                    "has_link": bool(item.link),
-                    "source_category": f"{item.source}_{item.category}"
-                }
-                news_json.append(news_dict)
-            
-            logger.info(f"✅ {len(news_json)} News als JSON gesammelt (mit URLs für GPT)")
+            # (ein Zeitstempel für alle Items statt datetime.now() pro Item)
+            now = datetime.now()
+            news_json = [self._news_to_dict(item, now) for item in news_items]
+            
+            logger.info("✅ {} News als JSON gesammelt (mit URLs für GPT)", len(news_json))
             return news_json
             
         except Exception as e:
@@ -777,6 +1044,58 @@ class DataCollectionService:
             logger.error(f"🔧 DEBUG: Traceback: {traceback.format_exc()}")
             return []
     
+    @staticmethod
+    def _dedupe_news_items(news_items: List[Any]) -> List[Any]:
+        """
+        Entfernt doppelte News (gleicher normalisierter Titel ODER gleicher Link)
+        
+        Die Liste ist nach Datum sortiert, daher bleibt jeweils die neueste
+        Fassung erhalten. Agenturmeldungen erscheinen oft in mehreren Feeds.
+        """
+        
+        seen_titles = set()
+        seen_links = set()
+        unique = []
+        
+        for item in news_items:
+            title_key = " ".join(item.title.lower().split())
+            link_key = item.link.strip()
+            if title_key in seen_titles or (link_key and link_key in seen_links):
+                continue
+            seen_titles.add(title_key)
+            if link_key:
+                seen_links.add(link_key)
+            unique.append(item)
+        
+        removed = len(news_items) - len(unique)
+        if removed:
+            logger.info("🧹 {} doppelte News entfernt ({}/{} behalten)", removed, len(unique), len(news_items))
+        
+        return unique
+    
+    @staticmethod
+    def _news_to_dict(item, now: datetime) -> Dict[str, Any]:
+        """Konvertiert ein RSSNewsItem in ein JSON-Dictionary (ein Dict-Literal, keine Reflection)"""
+        
+        published = item.published
+        summary = item.summary
+        return {
+            "title": item.title,
+            "summary": summary,
+            "link": item.link,  # WICHTIG: URL für GPT
+            "published": published.isoformat(),
+            "source": item.source,
+            "category": item.category,
+            "priority": item.priority,
+            "weight": item.weight,
+            # Zusätzliche Metadaten für GPT
+            "published_timestamp": published.timestamp(),
+            "age_hours": (now - published).total_seconds() / 3600,
+            "content_length": len(summary),
+            "has_link": bool(item.link),
+            "source_category": f"{item.source}_{item.category}"
+        }
+    
     async def _collect_weather_safe(self) -> Dict[str, Any]:
         """Sammelt ALLE Wetter-Daten - Current Weather nur"""
         logger.info("🌤️ Hole ALLE Zürich Wetter-Daten...")
@@ -799,7 +1118,7 @@ class DataCollectionService:
                     "description": weather_data["current"]["description"]
                 })
             
-            logger.info(f"✅ Zürich Wetter gesammelt (Current Weather)")
+            logger.info("✅ Zürich Wetter gesammelt (Current Weather)")
             return weather_data
             
         except Exception as e:
@@ -811,19 +1130,26 @@ class DataCollectionService:
         logger.info("₿ Hole ALLE Crypto-Daten...")
         
         try:
-            # Sammle ALLE verfügbaren Bitcoin-Informationen parallel
-            price_task = self.crypto_service.get_bitcoin_price()
-            trend_task = self.crypto_service.get_bitcoin_trend()
-            alerts_task = self.crypto_service.get_bitcoin_alerts(price_threshold=100000)
-            
-            price_data, trend_data, alerts_data = await asyncio.gather(
-                price_task, trend_task, alerts_task,
-                return_exceptions=True
-            )
+            # Preis EINMAL holen - Trend + Alerts werden daraus abgeleitet
+            # (vorher lösten alle drei bei kaltem Cache je einen CMC-Request aus)
+            try:
+                price_data = await self.crypto_service.get_bitcoin_price()
+            except Exception as e:
+                logger.warning(f"⚠️ Bitcoin-Preis nicht verfügbar: {e}")
+                price_data = None
+            
+            if price_data:
+                trend_data, alerts_data = await asyncio.gather(
+                    self.crypto_service.get_bitcoin_trend(bitcoin_data=price_data),
+                    self.crypto_service.get_bitcoin_alerts(price_threshold=100000, bitcoin_data=price_data),
+                    return_exceptions=True
+                )
+            else:
+                trend_data, alerts_data = None, []
             
             # Zusammenfassen aller Bitcoin-Daten
             crypto_data = {
-                "bitcoin": price_data if not isinstance(price_data, Exception) else None,
+                "bitcoin": price_data,
                 "trend": trend_data if not isinstance(trend_data, Exception) else None,
                 "alerts": alerts_data if not isinstance(alerts_data, Exception) else [],
                 "timestamp": datetime.now().isoformat()
@@ -843,7 +1169,7 @@ class DataCollectionService:
                     logger.warning(f"⚠️ Radio-Format-Generierung fehlgeschlagen: {e}")
             
             price = crypto_data["bitcoin"]["price_usd"] if crypto_data["bitcoin"] else "N/A"
-            logger.info(f"✅ Bitcoin: ${price:,.0f} (mit Trend + Alerts)")
+            logger.info("✅ Bitcoin: ${:,.0f} (mit Trend + Alerts)", price)
             return crypto_data
             
         except Exception as e:
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+Shared HTTP Session Helper
+==========================
+
+DataCollectionService hält EINE aiohttp.ClientSession (ein Connection-Pool,
+ein DNS-Cache) und hängt sie an RSS-, Weather- und Bitcoin-Service.
+Standalone genutzte Services fallen auf eine temporäre Session zurück.
+
+Dazu ein gemeinsamer Retry-Helper (exponentielles Backoff + Jitter,
+Retry-After bei 429/503) für vorübergehende Upstream-Fehler - genutzt von
+den Datenquellen und der ElevenLabs-Audio-Generierung.
+"""
+
+import asyncio
+import random
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import aiohttp
+from loguru import logger
+
+
+class UpstreamServerError(Exception):
+    """Upstream antwortete mit 429/5xx (vorübergehend, Retry sinnvoll)"""
+
+    def __init__(self, status: int, retry_after: Optional[str] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+# Fehler, bei denen sich ein Retry lohnt: Transport, Timeout, 429/5xx.
+# Übrige 4xx und Parse-Fehler sind dauerhaft und werden NICHT wiederholt.
+TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, UpstreamServerError)
+
+# Status-Codes, für die Aufrufer UpstreamServerError werfen sollen
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Obergrenze pro Wartezeit (auch für grosse Retry-After-Werte)
+_MAX_RETRY_DELAY = 30.0
+
+# Eigener RNG für Retry-Jitter (kein geteilter globaler random-State)
+_RNG = random.Random()
+
+
+def create_shared_session() -> aiohttp.ClientSession:
+    """Erstellt die gemeinsame Session für alle Datenquellen"""
+
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        limit_per_host=8,
+        ttl_dns_cache=300,
+        keepalive_timeout=60
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+@asynccontextmanager
+async def session_scope(
+    shared: Optional[aiohttp.ClientSession], **session_kwargs
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Liefert die geteilte Session, falls vorhanden und offen
+
+    Sonst wird eine temporäre Session mit session_kwargs erstellt und am Ende
+    geschlossen. Die geteilte Session wird NIE hier geschlossen.
+    """
+
+    if shared is not None and not shared.closed:
+        yield shared
+        return
+
+    async with aiohttp.ClientSession(**session_kwargs) as session:
+        yield session
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Retry-After (Sekunden) aus einem UpstreamServerError, sonst None"""
+    try:
+        return max(0.0, float(getattr(error, "retry_after", None)))
+    except (TypeError, ValueError):
+        return None
+
+
+async def retry_transient(
+    coro_factory: Callable[[], Awaitable[Any]],
+    label: str,
+    retries: int = 3,
+    base: float = 0.25,
+    jitter: float = 0.1
+) -> Any:
+    """
+    Führt coro_factory() aus und wiederholt bei TRANSIENT_ERRORS
+
+    Wartezeit: Retry-After des Upstreams falls gesetzt, sonst
+    base * 2^Versuch - höchstens _MAX_RETRY_DELAY, plus bis zu jitter
+    Sekunden (asyncio.sleep, die anderen Quellen laufen weiter). Nach dem
+    letzten Versuch wird der Fehler weitergereicht.
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            return await coro_factory()
+        except TRANSIENT_ERRORS as e:
+            if attempt == retries:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = base * 2 ** attempt
+            delay = min(delay, _MAX_RETRY_DELAY) + _RNG.random() * jitter
+            logger.warning(f"⚠️ {label}: vorübergehender Fehler ({e!r}) - Retry {attempt + 1}/{retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
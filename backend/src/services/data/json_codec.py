@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+"""
+Shared JSON Codec
+=================
+
+orjson (optional) serialisiert/parst direkt in/aus Bytes und ist deutlich
+schneller als stdlib json. Einziger Ort für den orjson-Import-Guard -
+Services, Routes und Audio-Generierung importieren von hier.
+"""
+
+import json
+import math
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(
+    data: Any,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialisiert data als UTF-8 JSON-Bytes (orjson falls verfügbar)
+
+    Beide Wege liefern dasselbe Format: kompakte Separatoren ohne indent,
+    NaN/Infinity als null (wie orjson). Mit default gehen datetime und
+    Dataclasses auch bei orjson über default (wie bei stdlib json, statt
+    orjsons eigenem ISO-/Dict-Format). Was orjson gar nicht kann (z.B.
+    Integer > 64 Bit), übernimmt stdlib json.
+    """
+
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            return orjson.dumps(data, default=default, option=option)
+        except orjson.JSONEncodeError:
+            pass
+
+    return json.dumps(
+        _finite(data),
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        default=default
+    ).encode("utf-8")
+
+
+def _finite(data: Any) -> Any:
+    """Ersetzt NaN/Infinity durch None (stdlib json würde ungültiges JSON schreiben)"""
+
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(value) for value in data]
+    return data
+
+
+def loads(raw: Any) -> Any:
+    """Dekodiert JSON aus Bytes oder str (orjson falls verfügbar)"""
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -11,8 +11,12 @@ Teil der Data Layer in der Clean Architecture.
 import asyncio
 import aiohttp
 import feedparser
+import heapq
+import re
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from loguru import logger
 
@@ -21,11 +25,33 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from database.supabase_client import get_db
+from .http_session import session_scope
 
+# Pro Request gesetzt, damit sie auch mit der geteilten Session gelten
+_REQUEST_HEADERS = {'User-Agent': 'RadioX RSS Reader 1.0'}
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
 
-@dataclass
+# Feed-Cache: Standard-TTL wenn der Feed weder <ttl> noch sy:updatePeriod angibt
+_DEFAULT_FEED_TTL_SECONDS = 60 * 60
+_UPDATE_PERIOD_SECONDS = {
+    "hourly": 3600,
+    "daily": 86400,
+    "weekly": 604800,
+    "monthly": 2592000,
+    "yearly": 31536000
+}
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+# Obergrenze gleichzeitig abgefragter Feeds (schont Upstreams + File-Deskriptoren)
+_MAX_CONCURRENT_FEEDS = 8
+
+# Obergrenze Feed-Cache-Einträge (feed_url x max_age_hours)
+_FEED_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass(slots=True)
 class RSSNewsItem:
-    """Einzelner RSS News Artikel"""
+    """Einzelner RSS News Artikel (slots: kein __dict__ pro Artikel)"""
     title: str
     summary: str
     link: str
@@ -46,6 +72,14 @@ class RSSService:
     def __init__(self):
         self.db = get_db()
         self.session = None
+        self._shared_session: Optional[aiohttp.ClientSession] = None
+        
+        # (feed_url, max_age_hours) -> (Ablauf monotonic, Items)
+        self._feed_cache: Dict[Tuple[str, int], Tuple[float, List[RSSNewsItem]]] = {}
+    
+    def attach_session(self, session: aiohttp.ClientSession) -> None:
+        """Nutzt eine extern verwaltete Session (z.B. von DataCollectionService)"""
+        self._shared_session = session
     
     async def get_all_active_feeds(self) -> List[Dict[str, Any]]:
         """
@@ -89,21 +123,23 @@ class RSSService:
             logger.warning("⚠️ Keine Feeds verfügbar")
             return []
         
+        self._prune_feed_cache()
+        
         # Sammle News von allen Feeds parallel
         all_news = []
         
-        # HTTP Session erstellen
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={'User-Agent': 'RadioX RSS Reader 1.0'}
-        ) as session:
+        # Geteilte Session nutzen oder temporäre erstellen
+        async with session_scope(self._shared_session) as session:
             self.session = session
             
-            # Sammle von allen Feeds parallel
-            tasks = []
-            for feed in feeds:
-                task = self._fetch_feed_news(feed, max_age_hours)
-                tasks.append(task)
+            # Sammle von allen Feeds parallel, aber höchstens _MAX_CONCURRENT_FEEDS gleichzeitig
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FEEDS)
+            
+            async def _bounded(feed: Dict[str, Any]) -> List[RSSNewsItem]:
+                async with semaphore:
+                    return await self._fetch_feed_news(feed, max_age_hours)
+            
+            tasks = [_bounded(feed) for feed in feeds]
             
             # Warte auf alle Feeds
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -114,13 +150,27 @@ class RSSService:
                     logger.error(f"❌ Feed {i+1} Fehler: {result}")
                 elif isinstance(result, list):
                     all_news.extend(result)
+            
+            self.session = None
         
         # Sortiere nach Datum (neueste zuerst)
-        all_news.sort(key=lambda x: x.published, reverse=True)
+        all_news.sort(key=attrgetter("published"), reverse=True)
         
-        logger.info(f"✅ {len(all_news)} News gesammelt von {len(feeds)} Feeds")
+        logger.info("✅ {} News gesammelt von {} Feeds", len(all_news), len(feeds))
         return all_news
     
+    def _prune_feed_cache(self) -> None:
+        """Entfernt abgelaufene Feed-Cache-Einträge, danach die am frühesten ablaufenden über der Obergrenze"""
+        
+        now = time.monotonic()
+        for key in [key for key, (expires, _) in self._feed_cache.items() if expires <= now]:
+            del self._feed_cache[key]
+        
+        overflow = len(self._feed_cache) - _FEED_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            for key in heapq.nsmallest(overflow, self._feed_cache, key=lambda k: self._feed_cache[k][0]):
+                del self._feed_cache[key]
+    
     async def _fetch_feed_news(self, feed: Dict[str, Any], max_age_hours: int) -> List[RSSNewsItem]:
         """
         Sammelt News von einem einzelnen Feed
@@ -141,17 +191,29 @@ class RSSService:
         if not feed_url:
             logger.warning(f"⚠️ Feed {feed_name} hat keine URL")
             return []
+        
+        cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        
+        # Feed noch innerhalb seiner TTL? Dann kein erneuter Poll
+        cache_key = (feed_url, max_age_hours)
+        cached = self._feed_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            logger.debug("♻️ {}: aus Feed-Cache", feed_name)
+            return [item for item in cached[1] if item.published >= cutoff_time]
     
         try:
-            logger.debug(f"📡 Lade Feed: {feed_name}")
+            logger.debug("📡 Lade Feed: {}", feed_name)
             
             # HTTP Request
-            async with self.session.get(feed_url) as response:
+            async with self.session.get(
+                feed_url, headers=_REQUEST_HEADERS, timeout=_REQUEST_TIMEOUT
+            ) as response:
                 if response.status != 200:
                     logger.warning(f"⚠️ Feed {feed_name} HTTP {response.status}")
                     return []
     
                 content = await response.text()
+                cache_control = response.headers.get('Cache-Control', '')
             
             # Parse RSS/Atom Feed
             parsed_feed = feedparser.parse(content)
@@ -161,7 +223,6 @@ class RSSService:
             
             # Konvertiere Entries zu RSSNewsItem
             news_items = []
-            cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
             
             for entry in parsed_feed.entries:
                 try:
@@ -190,13 +251,52 @@ class RSSService:
                     logger.warning(f"⚠️ Fehler bei Entry von {feed_name}: {e}")
                     continue
             
-            logger.debug(f"✅ {feed_name}: {len(news_items)} News")
+            # Cachen gemäss Feed-TTL (<ttl>, sy:updatePeriod, Cache-Control)
+            ttl_seconds = self._feed_ttl_seconds(parsed_feed, cache_control)
+            self._feed_cache[cache_key] = (time.monotonic() + ttl_seconds, news_items)
+            
+            logger.debug("✅ {}: {} News (TTL {:.0f} min)", feed_name, len(news_items), ttl_seconds / 60)
             return news_items
             
         except Exception as e:
             logger.error(f"❌ Fehler bei Feed {feed_name}: {e}")
             return []
     
+    def _feed_ttl_seconds(self, parsed_feed: Any, cache_control: str) -> float:
+        """
+        Ermittelt wie lange ein Feed nicht erneut gepollt werden muss
+        
+        Reihenfolge: RSS 2.0 <ttl> (Minuten), dann sy:updatePeriod /
+        sy:updateFrequency, sonst 60 Minuten. Cache-Control max-age gilt
+        zusätzlich als Untergrenze.
+        """
+        
+        channel = parsed_feed.feed
+        ttl_seconds = None
+        
+        try:
+            ttl_seconds = int(channel.get('ttl')) * 60
+        except (TypeError, ValueError):
+            pass
+        
+        if ttl_seconds is None:
+            period = str(channel.get('sy_updateperiod', '')).strip().lower()
+            if period in _UPDATE_PERIOD_SECONDS:
+                try:
+                    frequency = max(1, int(channel.get('sy_updatefrequency', 1)))
+                except (TypeError, ValueError):
+                    frequency = 1
+                ttl_seconds = _UPDATE_PERIOD_SECONDS[period] / frequency
+        
+        if ttl_seconds is None:
+            ttl_seconds = _DEFAULT_FEED_TTL_SECONDS
+        
+        max_age = _MAX_AGE_RE.search(cache_control or '')
+        if max_age:
+            ttl_seconds = max(ttl_seconds, int(max_age.group(1)))
+        
+        return ttl_seconds
+    
     def _parse_entry_date(self, entry: Dict[str, Any]) -> datetime:
         """Parse das Datum eines RSS Entry"""
         
@@ -249,20 +349,11 @@ class RSSService:
         """
         
         try:
-            # HTTP Session erstellen falls nicht vorhanden
-            if not self.session:
-                async with aiohttp.ClientSession(
-                    timeout=aiohttp.ClientTimeout(total=30),
-                    headers={'User-Agent': 'RadioX RSS Reader 1.0'}
-                ) as session:
-                    async with session.get(feed_url) as response:
-                        if response.status != 200:
-                            logger.warning(f"⚠️ Feed HTTP {response.status}: {feed_url}")
-                            return []
-                        
-                        content = await response.text()
-            else:
-                async with self.session.get(feed_url) as response:
+            # Geteilte Session nutzen oder temporäre erstellen
+            async with session_scope(self._shared_session) as session:
+                async with session.get(
+                    feed_url, headers=_REQUEST_HEADERS, timeout=_REQUEST_TIMEOUT
+                ) as response:
                     if response.status != 200:
                         logger.warning(f"⚠️ Feed HTTP {response.status}: {feed_url}")
                         return []
@@ -287,7 +378,7 @@ class RSSService:
                 }
                 items.append(item)
             
-            logger.debug(f"✅ {len(items)} Items von {feed_url}")
+            logger.debug("✅ {} Items von {}", len(items), feed_url)
             return items
             
         except Exception as e:
@@ -15,21 +15,58 @@ DEPENDENCIES: Only OpenWeatherMap API Key
 
 import asyncio
 import aiohttp
-from typing import Dict, Any, Optional, List
+import json
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
 from datetime import datetime, timedelta
 from loguru import logger
 from dataclasses import dataclass
+from functools import lru_cache
 
 # Import Settings
 from config.settings import get_settings
+from .http_session import TRANSIENT_ERRORS, UpstreamServerError, retry_transient, session_scope
+from .json_codec import loads as _loads
 
-@dataclass
+@dataclass(frozen=True)
 class WeatherLocation:
     """Weather location definition"""
     name: str
     city_id: int  # OpenWeatherMap City ID
     country_code: str = "CH"
 
+
+# Per-request timeout so a hanging API call is retried instead of blocking collection
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Swiss cities with OpenWeatherMap City IDs (module-level, built once, read-only
+# because _resolve_location caches lookups against it)
+LOCATIONS: Mapping[str, WeatherLocation] = MappingProxyType({
+    "zurich": WeatherLocation("Zürich", 2657896, "CH"),
+    "basel": WeatherLocation("Basel", 2661604, "CH"),
+    "geneva": WeatherLocation("Geneva", 2660646, "CH"),
+    "bern": WeatherLocation("Bern", 2661552, "CH"),
+    "lausanne": WeatherLocation("Lausanne", 2659994, "CH"),
+    "winterthur": WeatherLocation("Winterthur", 2657970, "CH"),
+    "lucerne": WeatherLocation("Lucerne", 2659811, "CH"),
+    "st_gallen": WeatherLocation("St. Gallen", 2658822, "CH")
+})
+
+# Alternative spellings -> location key
+_LOCATION_ALIASES: Mapping[str, str] = MappingProxyType({
+    "zürich": "zurich",
+    "zuerich": "zurich",
+    "Zürich": "zurich",
+    "Zuerich": "zurich"
+})
+
+
+@lru_cache(maxsize=32)
+def _resolve_location(location: str) -> Optional[str]:
+    """Normalizes a city name to a LOCATIONS key (None if unknown)"""
+    key = _LOCATION_ALIASES.get(location, location.lower())
+    return key if key in LOCATIONS else None
+
 class WeatherService:
     """OpenWeatherMap Weather Service for RadioX"""
     
@@ -40,16 +77,14 @@ class WeatherService:
         self.base_url = "https://api.openweathermap.org/data/2.5"
         
         # Swiss cities with OpenWeatherMap City IDs
-        self.locations = {
-            "zurich": WeatherLocation("Zürich", 2657896, "CH"),
-            "basel": WeatherLocation("Basel", 2661604, "CH"),
-            "geneva": WeatherLocation("Geneva", 2660646, "CH"),
-            "bern": WeatherLocation("Bern", 2661552, "CH"),
-            "lausanne": WeatherLocation("Lausanne", 2659994, "CH"),
-            "winterthur": WeatherLocation("Winterthur", 2657970, "CH"),
-            "lucerne": WeatherLocation("Lucerne", 2659811, "CH"),
-            "st_gallen": WeatherLocation("St. Gallen", 2658822, "CH")
-        }
+        self.locations = LOCATIONS
+        
+        # Optional externally managed session (see attach_session)
+        self._shared_session: Optional[aiohttp.ClientSession] = None
+    
+    def attach_session(self, session: aiohttp.ClientSession) -> None:
+        """Uses an externally managed session (e.g. from DataCollectionService)"""
+        self._shared_session = session
         
     def _check_api_key(self) -> bool:
         """Checks if API key is available"""
@@ -65,19 +100,13 @@ class WeatherService:
                 return None
                 
             # Normalize city names
-            location_mapping = {
-                "zürich": "zurich",
-                "zuerich": "zurich",
-                "Zürich": "zurich",
-                "Zuerich": "zurich"
-            }
-            location = location_mapping.get(location, location.lower())
+            location_key = _resolve_location(location)
             
-            if location not in self.locations:
+            if location_key is None:
                 logger.warning(f"Unknown city: {location}, using fallback: zurich")
-                location = "zurich"
+                location_key = "zurich"
             
-            loc = self.locations[location]
+            loc = self.locations[location_key]
             
             # Build API URL
             url = f"{self.base_url}/weather"
@@ -88,38 +117,44 @@ class WeatherService:
                 "lang": "en"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with session_scope(self._shared_session) as session:
+                
+                async def _request_weather():
+                    # async with releases the connection back to the pool
+                    async with session.get(url, params=params, timeout=_REQUEST_TIMEOUT) as response:
+                        if response.status >= 500:
+                            raise UpstreamServerError(response.status)
+                        body = await response.read() if response.status == 200 else b""
+                        return response.status, body
+                
                 try:
-                    # Get weather data from OpenWeatherMap
-                    response = await session.get(url, params=params)
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Extract relevant data
-                        weather_info = {
-                            "temperature": round(data["main"]["temp"], 1),
-                            "feels_like": round(data["main"]["feels_like"], 1),
-                            "humidity": data["main"]["humidity"],
-                            "pressure": data["main"]["pressure"],
-                            "description": data["weather"][0]["description"],
-                            "wind_speed": round(data.get("wind", {}).get("speed", 0) * 3.6, 1),  # m/s to km/h
-                            "wind_direction": data.get("wind", {}).get("deg", 0),
-                            "visibility": round(data.get("visibility", 0) / 1000, 1),  # km
-                            "clouds": data.get("clouds", {}).get("all", 0),
-                            "location": loc.name,
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
-                        return weather_info
-                    else:
-                        logger.error(f"❌ OpenWeatherMap API error: {response.status}")
-                        return None
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error retrieving weather: {e}")
+                    # Get weather data from OpenWeatherMap (5xx/timeouts retried with backoff)
+                    status, raw = await retry_transient(_request_weather, "OpenWeatherMap")
+                except TRANSIENT_ERRORS as e:
+                    logger.error(f"❌ OpenWeatherMap request failed after retries: {e!r}")
                     return None
-                        
+            
+            if status != 200:
+                logger.error(f"❌ OpenWeatherMap API error: {status}")
+                return None
+            
+            data = _loads(raw)
+            
+            # Extract relevant data
+            return {
+                "temperature": round(data["main"]["temp"], 1),
+                "feels_like": round(data["main"]["feels_like"], 1),
+                "humidity": data["main"]["humidity"],
+                "pressure": data["main"]["pressure"],
+                "description": data["weather"][0]["description"],
+                "wind_speed": round(data.get("wind", {}).get("speed", 0) * 3.6, 1),  # m/s to km/h
+                "wind_direction": data.get("wind", {}).get("deg", 0),
+                "visibility": round(data.get("visibility", 0) / 1000, 1),  # km
+                "clouds": data.get("clouds", {}).get("all", 0),
+                "location": loc.name,
+                "timestamp": datetime.now().isoformat()
+            }
+            
         except Exception as e:
             logger.error(f"❌ Error retrieving weather: {e}")
             return None
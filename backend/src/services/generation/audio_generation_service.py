@@ -10,8 +10,13 @@ Verwendet die neuesten ElevenLabs Modelle (v2, v2.5, v3).
 """
 
 import asyncio
+import aiofiles
 import aiohttp
+import hashlib
 import json
+import os
+import shutil
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
@@ -34,6 +39,52 @@ except ImportError:
 # Import Voice Configuration Service
 from src.services.voice_config_service import get_voice_config_service
 
+# Gemeinsamer JSON-Codec (orjson falls verfügbar)
+from ..data.json_codec import dumps as _dumps, loads as _loads
+
+# HTTP Session Pool (Recycling + Invalidierung der ElevenLabs-Session)
+from .._http_pool import PooledSession
+
+# Gemeinsamer Retry-Helper (Backoff + Jitter, Retry-After bei 429)
+from ..data.http_session import RETRYABLE_STATUSES, UpstreamServerError, retry_transient
+
+# Chunk-Grösse beim Streamen der MP3-Antwort auf Disk (weniger Schleifen/Writes als 8 KiB)
+_AUDIO_CHUNK_SIZE = 64 * 1024
+
+# ElevenLabs: Verbindungsaufbau schnell abbrechen; kein Gesamt-Limit, damit lange
+# (zusammengefasste) Segmente fertig rendern - nur 60s Stille im Stream bricht ab
+_ELEVENLABS_TIMEOUT = aiohttp.ClientTimeout(total=None, connect=10, sock_read=60)
+
+
+# Request-Header für Text-to-Speech (xi-api-key kommt aus den Session-Headern)
+_TTS_HEADERS = {
+    "Accept": "audio/mpeg",
+    "Content-Type": "application/json"
+}
+
+
+@lru_cache(maxsize=32)
+def _voice_settings(stability: float, similarity_boost: float, style: float, use_speaker_boost: bool) -> Dict[str, Any]:
+    """
+    voice_settings-Payload pro Einstellungs-Kombination, einmal gebaut
+    
+    Alle Segmente eines Sprechers teilen sich dasselbe Dict (wird nur
+    serialisiert, nie verändert).
+    """
+    return {
+        "stability": stability,
+        "similarity_boost": similarity_boost,
+        "style": style,
+        "use_speaker_boost": use_speaker_boost
+    }
+
+
+# Maximale Textlänge, wenn Zeilen desselben Sprechers zu einem Request verbunden werden
+_MAX_TTS_CHARS = 2500
+
+# TTS-Cache: identischer Text + Voice + Settings -> identisches MP3 (Intros, Outros, Floskeln)
+_TTS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
 
 class AudioGenerationService:
     """
@@ -42,7 +93,7 @@ class AudioGenerationService:
     Verwendet neueste ElevenLabs Modelle (v2, v2.5, v3)
     """
     
-    def __init__(self):
+    def __init__(self, max_retries: int = 4):
         # Load settings centrally
         self.settings = get_settings()
         
@@ -70,6 +121,46 @@ class AudioGenerationService:
         # Output-Verzeichnis - DIREKT IM ROOT (nicht in backend/)
         self.output_dir = Path(__file__).parent.parent.parent.parent / "outplay"
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # TTS-Cache (Unterordner, wird von den *.mp3-Cleanups im Output-Ordner nicht erfasst)
+        self.tts_cache_dir = self.output_dir / ".tts_cache"
+        self.tts_cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Wiederholungen bei 429/5xx/Verbindungsfehlern pro Segment
+        self.max_retries = max_retries
+        
+        # Persistente HTTP-Session zu ElevenLabs (Keep-Alive: kein TLS-Handshake pro Segment),
+        # alle 5 Minuten bzw. nach Verbindungsfehlern frisch aufgebaut
+        self._http = PooledSession(self._create_session, max_session_duration=300)
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Baut die ElevenLabs-Session (Factory für PooledSession)"""
+        
+        # HTTP/1.1: eine Verbindung pro parallelem Request. So viele Keep-Alive-
+        # Verbindungen wie parallele Segmente, die dann über den Broadcast
+        # hinweg wiederverwendet werden (keine neuen TLS-Handshakes).
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            limit_per_host=max(1, self.settings.elevenlabs_max_concurrent),
+            keepalive_timeout=60,
+            ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={"xi-api-key": self.elevenlabs_api_key or ""},
+            timeout=_ELEVENLABS_TIMEOUT
+        )
+    
+    async def aclose(self) -> None:
+        """Schliesst die ElevenLabs-Session (einmal beim Shutdown aufrufen)"""
+        
+        await self._http.aclose()
+    
+    async def __aenter__(self) -> "AudioGenerationService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
     
     async def get_voice_with_fallback(self, speaker_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -174,12 +265,13 @@ class AudioGenerationService:
             segments = self._parse_script_segments(script_content)
             logger.info(f"📝 {len(segments)} Sprecher-Segmente gefunden")
             
-            # 2. Audio für jeden Sprecher generieren
+            # Aufeinanderfolgende Zeilen desselben Sprechers = EIN TTS-Request
+            segments = self._merge_consecutive_segments(segments)
+            
+            # 2. Audio für jeden Sprecher generieren (parallel, Reihenfolge bleibt erhalten)
+            audio_files = await self._generate_segments_batch(segments, session_id)
             audio_segments = []
-            for i, segment in enumerate(segments):
-                audio_file = await self._generate_segment_audio(
-                    segment, session_id, i
-                )
+            for segment, audio_file in zip(segments, audio_files):
                 if audio_file:
                     audio_segments.append({
                         "speaker": segment["speaker"],
@@ -273,6 +365,38 @@ class AudioGenerationService:
         
         return segments
     
+    def _merge_consecutive_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Fasst aufeinanderfolgende Segmente desselben Sprechers zusammen
+        
+        Die Segmente werden ohnehin hintereinander zusammengefügt; ein Request
+        pro Sprecher-Block spart Round-Trips und klingt durchgehender. Blöcke
+        werden bei _MAX_TTS_CHARS getrennt (Latenz + ElevenLabs-Textlimit).
+        
+        Die V3-Tags arbeiten zeilenweise (Pausen nach ". ", [laughs] bei "!"),
+        deshalb wird jede Zeile VOR dem Zusammenfassen einzeln angereichert
+        und als "tts_text" mitgeführt; "text" bleibt der Original-Text.
+        """
+        
+        merged: List[Dict[str, Any]] = []
+        for segment in segments:
+            tts_text = self._enhance_text_with_v3_tags(segment["text"], segment["speaker"])
+            last = merged[-1] if merged else None
+            if (
+                last is not None
+                and last["speaker"] == segment["speaker"]
+                and len(last["tts_text"]) + len(tts_text) + 1 <= _MAX_TTS_CHARS
+            ):
+                last["text"] = f"{last['text']}\n{segment['text']}"
+                last["tts_text"] = f"{last['tts_text']}\n{tts_text}"
+            else:
+                merged.append({**segment, "tts_text": tts_text})
+        
+        if len(merged) < len(segments):
+            logger.info(f"🔗 {len(segments)} Zeilen zu {len(merged)} TTS-Requests zusammengefasst")
+        
+        return merged
+    
     def _clean_speaker_name(self, speaker_raw: str) -> str:
         """Bereinigt Speaker-Namen von Formatierungs-Artefakten"""
         
@@ -310,6 +434,28 @@ class AudioGenerationService:
         
         return mapped_speaker
     
+    async def _generate_segments_batch(
+        self,
+        segments: List[Dict[str, Any]],
+        session_id: str,
+        max_concurrent: Optional[int] = None
+    ) -> List[Optional[Path]]:
+        """
+        Generiert Audio für alle Segmente parallel
+        
+        Höchstens max_concurrent Requests gleichzeitig (Standard:
+        settings.elevenlabs_max_concurrent). Ergebnis in Segment-Reihenfolge,
+        None für fehlgeschlagene Segmente.
+        """
+        
+        semaphore = asyncio.Semaphore(max_concurrent or self.settings.elevenlabs_max_concurrent)
+        
+        async def _bounded(segment: Dict[str, Any], index: int) -> Optional[Path]:
+            async with semaphore:
+                return await self._generate_segment_audio(segment, session_id, index)
+        
+        return await asyncio.gather(*(_bounded(segment, i) for i, segment in enumerate(segments)))
+    
     async def _generate_segment_audio(
         self, 
         segment: Dict[str, Any], 
@@ -338,51 +484,134 @@ class AudioGenerationService:
                 logger.error(f"❌ Keine Voice-Konfiguration für '{speaker}' verfügbar")
                 return None
             
-            # ElevenLabs API Request (v1 Endpoint mit neuesten Modellen)
-            headers = {
-                "Accept": "audio/mpeg",
-                "Content-Type": "application/json",
-                "xi-api-key": self.elevenlabs_api_key
-            }
-            
             # ElevenLabs Enhanced Request mit Audio Tags Support (neueste Modelle)
-            enhanced_text = self._enhance_text_with_v3_tags(text, speaker)
+            # Zusammengefasste Segmente sind bereits zeilenweise angereichert
+            enhanced_text = segment.get("tts_text") or self._enhance_text_with_v3_tags(text, speaker)
             
             data = {
                 "text": enhanced_text,
                 "model_id": voice_config.get("model", "eleven_multilingual_v2"),  # Neueste Modelle (v2, v2.5, v3)
-                "voice_settings": {
-                    "stability": voice_config["stability"],
-                    "similarity_boost": voice_config["similarity_boost"],
-                    "style": voice_config["style"],
-                    "use_speaker_boost": voice_config["use_speaker_boost"]
-                }
+                "voice_settings": _voice_settings(
+                    voice_config["stability"],
+                    voice_config["similarity_boost"],
+                    voice_config["style"],
+                    voice_config["use_speaker_boost"]
+                )
             }
             
+            # ElevenLabs API Request (v1 Endpoint mit neuesten Modellen)
             url = f"{self.elevenlabs_base_url}/text-to-speech/{voice_config['voice_id']}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, headers=headers, json=data) as response:
+            # Cache-Treffer: kein API-Call, nur Link/Kopie ins Output-Verzeichnis
+            cached_path = self.tts_cache_dir / f"{self._tts_cache_key(voice_config['voice_id'], data)}.mp3"
+            if await asyncio.to_thread(self._use_cached_audio, cached_path, audio_path):
+                if segment_index < 3:
+                    logger.info(f"♻️ Audio-Segment aus TTS-Cache: {audio_filename}")
+                return audio_path
+            
+            body = _dumps(data)
+            
+            async def _request() -> bool:
+                async with self._http.lease() as session, session.post(url, headers=_TTS_HEADERS, data=body) as response:
                     
-                    if response.status == 200:
-                        # Audio-Datei speichern
-                        with open(audio_path, 'wb') as f:
-                            async for chunk in response.content.iter_chunked(8192):
-                                f.write(chunk)
-                        
-                        # Nur bei ersten paar Segmenten loggen
-                        if segment_index < 3:
-                            logger.info(f"✅ Audio-Segment gespeichert: {audio_filename}")
-                        return audio_path
+                    if response.status in RETRYABLE_STATUSES:
+                        # 429: Retry-After respektieren, 5xx: exponentielles Backoff (retry_transient)
+                        raise UpstreamServerError(response.status, response.headers.get("Retry-After"))
                     
-                    else:
+                    if response.status != 200:
                         logger.error(f"❌ ElevenLabs API Fehler {response.status}")
-                        return None
+                        return False
+                    
+                    # Audio-Datei in den Cache streamen (.part + replace = atomar)
+                    part_path = cached_path.with_name(f"{cached_path.stem}.{session_id}_{segment_index}.part")
+                    try:
+                        # aiofiles: Disk-Writes blockieren die parallelen Segmente nicht
+                        async with aiofiles.open(part_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(_AUDIO_CHUNK_SIZE):
+                                await f.write(chunk)
+                        os.replace(part_path, cached_path)
+                    except BaseException:
+                        part_path.unlink(missing_ok=True)
+                        raise
+                    return True
+            
+            try:
+                # Verbindung ist zurück im Pool, bevor retry_transient wartet
+                stored = await retry_transient(
+                    _request, f"ElevenLabs Segment {segment_index}",
+                    retries=self.max_retries, base=1.0, jitter=0.5
+                )
+            except UpstreamServerError as e:
+                logger.error(f"❌ ElevenLabs API Fehler {e.status} (nach {self.max_retries} Retries)")
+                return None
+            
+            if not stored:
+                return None
+            
+            # Segment-Dateien werden nur gelesen (concat) und gelöscht -> Hardlink ist sicher
+            await asyncio.to_thread(self._link_or_copy, cached_path, audio_path)
+            await asyncio.to_thread(self._prune_tts_cache)
+            
+            # Nur bei ersten paar Segmenten loggen
+            if segment_index < 3:
+                logger.info(f"✅ Audio-Segment gespeichert: {audio_filename}")
+            return audio_path
         
         except Exception as e:
             logger.error(f"❌ Fehler bei Segment-Audio-Generierung: {e}")
             return None
     
+    @staticmethod
+    def _tts_cache_key(voice_id: str, payload: Dict[str, Any]) -> str:
+        """
+        SHA-256 über Voice-ID + kompletten Request (Text, Modell, Voice-Settings)
+        
+        Bewusst stdlib json (sort_keys): der Schlüssel bleibt gleich, egal ob
+        orjson installiert ist.
+        """
+        raw = json.dumps([voice_id, payload], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    
+    @classmethod
+    def _use_cached_audio(cls, cached_path: Path, target: Path) -> bool:
+        """
+        Verlinkt einen Cache-Treffer nach target (im Thread aufrufen)
+        
+        False = Cache-Miss, auch wenn _prune_tts_cache die Datei zwischen
+        Prüfung und Link gelöscht hat.
+        """
+        try:
+            os.utime(cached_path)  # mtime = zuletzt benutzt (LRU)
+            cls._link_or_copy(cached_path, target)
+        except FileNotFoundError:
+            return False
+        return True
+    
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path) -> None:
+        """Hardlink (kein Kopieren), Fallback auf Kopie z.B. über Dateisystemgrenzen"""
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+    
+    def _prune_tts_cache(self) -> None:
+        """Löscht die am längsten unbenutzten Cache-Dateien über _TTS_CACHE_MAX_BYTES"""
+        
+        try:
+            entries = [(f.stat(), f) for f in self.tts_cache_dir.glob("*.mp3")]
+            total = sum(stat.st_size for stat, _ in entries)
+            if total <= _TTS_CACHE_MAX_BYTES:
+                return
+            
+            for stat, cache_file in sorted(entries, key=lambda entry: entry[0].st_mtime):
+                cache_file.unlink(missing_ok=True)
+                total -= stat.st_size
+                if total <= _TTS_CACHE_MAX_BYTES:
+                    break
+        except OSError as e:
+            logger.warning(f"⚠️ TTS-Cache konnte nicht bereinigt werden: {e}")
+    
     def _enhance_text_with_v3_tags(self, text: str, speaker: str) -> str:
         """
         🎭 ElevenLabs Text Enhancement - V3 OPTIMIZED
@@ -716,23 +945,21 @@ class AudioGenerationService:
             return {"error": "ElevenLabs API Key nicht verfügbar"}
         
         try:
-            headers = {"xi-api-key": self.elevenlabs_api_key}
             url = f"{self.elevenlabs_base_url}/voices"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as response:
-                    
-                    if response.status == 200:
-                        data = await response.json()
-                        return {
-                            "success": True,
-                            "voices": data.get("voices", [])
-                        }
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"API Fehler {response.status}"
-                        }
+            async with self._http.lease() as session, session.get(url) as response:
+                
+                if response.status == 200:
+                    data = _loads(await response.read())
+                    return {
+                        "success": True,
+                        "voices": data.get("voices", [])
+                    }
+                else:
+                    return {
+                        "success": False,
+                        "error": f"API Fehler {response.status}"
+                    }
         
         except Exception as e:
             return {
@@ -1164,12 +1391,14 @@ Thanks for tuning in to RadioX AI News!"""
             # Session-ID Pattern (erste 8 Zeichen)
             session_short = session_id[:8] if len(session_id) >= 8 else session_id
             
-            # Suche nach Session-bezogenen Dateien
+            # Suche nach Session-bezogenen Dateien (Set für O(1) Membership-Check)
+            already_listed = set(files_to_delete)
             for directory in [output_audio_dir, output_covers_dir]:
                 if directory.exists():
                     for file_path in directory.glob("*"):
                         if file_path.is_file() and session_short in file_path.name:
-                            if file_path not in files_to_delete:
+                            if file_path not in already_listed:
+                                already_listed.add(file_path)
                                 files_to_delete.append(file_path)
             
             # 4. Dateien sicher löschen
@@ -1835,7 +2064,10 @@ async def main():
     
     # Test Audio Generation
     print("\n🔊 Teste Audio-Generierung...")
-    success = await service.test_audio()
+    try:
+        success = await service.test_audio()
+    finally:
+        await service.aclose()
     
     if success:
         print("✅ Audio Generation Service funktioniert!")
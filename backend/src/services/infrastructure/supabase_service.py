@@ -5,7 +5,8 @@ Speichert und verwaltet Radio-Skripte in der Supabase Datenbank
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import ClassVar, Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from loguru import logger
 from dataclasses import dataclass, asdict
@@ -14,9 +15,16 @@ from pathlib import Path
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+# Import centralized settings
+from config.settings import get_settings
+
 # Load environment variables from root directory
 load_dotenv(Path(__file__).parent.parent.parent.parent / '.env')
 
+# Werte pro .in_()-Filter: die Liste landet in der Request-URL (PostgREST GET),
+# zu viele Titel sprengen das URL-Limit
+_IN_FILTER_BATCH_SIZE = 50
+
 
 @dataclass
 class RadioScript:
@@ -38,14 +46,11 @@ class RadioScript:
 class SupabaseService:
     """Supabase Service für RadioX"""
     
+    # Ein Client pro Prozess - alle Instanzen teilen sich dieselbe Verbindung
+    _shared_client: ClassVar[Optional[Client]] = None
+    
     def __init__(self):
-        # Lade Environment-Variablen (mehrere Varianten für Kompatibilität)
-                # Import centralized settings
-        import sys
-        from pathlib import Path
-        sys.path.append(str(Path(__file__).parent.parent))
-        from config.settings import get_settings
-        
+        # Zentrale Settings (Import einmal auf Modulebene)
         settings = get_settings()
         self.supabase_url = settings.supabase_url
         self.supabase_key = settings.supabase_anon_key
@@ -57,8 +62,27 @@ class SupabaseService:
             logger.info(f"🔍 SUPABASE_ANON_KEY: {'✅ gefunden' if self.supabase_key else '❌ fehlt'}")
             raise ValueError("❌ Supabase Credentials fehlen!")
         
-        self.client: Client = create_client(self.supabase_url, self.supabase_key)
-        logger.info("✅ Supabase Client initialisiert")
+        if SupabaseService._shared_client is None:
+            SupabaseService._shared_client = create_client(self.supabase_url, self.supabase_key)
+            logger.info("✅ Supabase Client initialisiert")
+        
+        self.client: Client = SupabaseService._shared_client
+    
+    async def _select_in(self, table: str, columns: str, column: str, values: List[str]) -> List[Dict[str, Any]]:
+        """
+        SELECT columns FROM table WHERE column IN values - in Batches
+        
+        Jeder Batch ist ein eigener Roundtrip (im Thread, der Supabase Client
+        ist synchron); die Zeilen aller Batches werden zusammengeführt.
+        """
+        rows: List[Dict[str, Any]] = []
+        for start in range(0, len(values), _IN_FILTER_BATCH_SIZE):
+            batch = values[start:start + _IN_FILTER_BATCH_SIZE]
+            result = await asyncio.to_thread(
+                self.client.table(table).select(columns).in_(column, batch).execute
+            )
+            rows.extend(result.data or [])
+        return rows
     
     async def save_radio_script(self, script_data: Dict[str, Any]) -> str:
         """Speichert ein Radio-Skript in Supabase"""
@@ -177,35 +201,48 @@ class SupabaseService:
             return False
     
     async def save_news_content(self, news_items: List[Dict[str, Any]]) -> int:
-        """Speichert News-Content in Supabase"""
+        """Speichert News-Content in Supabase (ein Select + ein Batch-Insert)"""
         try:
-            saved_count = 0
+            if not news_items:
+                return 0
+            
+            # Bereits existierende Titel gebündelt holen (Duplikat-Vermeidung)
+            titles = list({news_item.get('title', '') for news_item in news_items})
+            existing = await self._select_in('news_content', 'title', 'title', titles)
+            seen_titles = {row['title'] for row in existing}
+            
+            created_at = datetime.utcnow().isoformat()
+            rows = []
             
             for news_item in news_items:
-                # Prüfen ob News bereits existiert (Duplikat-Vermeidung)
-                existing = self.client.table('news_content').select('id').eq('title', news_item.get('title')).execute()
+                title = news_item.get('title', '')
+                if title in seen_titles:
+                    continue
+                seen_titles.add(title)
                 
-                if not existing.data:
-                    # News-Item für Supabase vorbereiten
-                    news_data = {
-                        'title': news_item.get('title', ''),
-                        'summary': news_item.get('summary', ''),
-                        'source': news_item.get('source', ''),
-                        'category': news_item.get('category', ''),
-                        'priority': news_item.get('priority', 5),
-                        'published_at': news_item.get('timestamp', datetime.utcnow()).isoformat(),
-                        'content_type': 'rss_news',
-                        'metadata': {
-                            'link': news_item.get('link', ''),
-                            'tags': news_item.get('tags', [])
-                        },
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    
-                    result = self.client.table('news_content').insert(news_data).execute()
-                    
-                    if result.data:
-                        saved_count += 1
+                # News-Item für Supabase vorbereiten
+                rows.append({
+                    'title': title,
+                    'summary': news_item.get('summary', ''),
+                    'source': news_item.get('source', ''),
+                    'category': news_item.get('category', ''),
+                    'priority': news_item.get('priority', 5),
+                    'published_at': news_item.get('timestamp', datetime.utcnow()).isoformat(),
+                    'content_type': 'rss_news',
+                    'metadata': {
+                        'link': news_item.get('link', ''),
+                        'tags': news_item.get('tags', [])
+                    },
+                    'created_at': created_at
+                })
+            
+            saved_count = 0
+            if rows:
+                # Supabase REST akzeptiert ein JSON-Array → 1 Roundtrip statt N
+                result = await asyncio.to_thread(
+                    self.client.table('news_content').insert(rows).execute
+                )
+                saved_count = len(result.data) if result.data else 0
             
             logger.info(f"✅ {saved_count} News-Items in Supabase gespeichert")
             return saved_count
@@ -215,40 +252,56 @@ class SupabaseService:
             return 0
     
     async def save_tweet_content(self, tweets: List[Dict[str, Any]]) -> int:
-        """Speichert Tweet-Content in Supabase"""
+        """Speichert Tweet-Content in Supabase (ein Select + ein Batch-Insert)"""
         try:
-            saved_count = 0
+            if not tweets:
+                return 0
+            
+            # Bereits gespeicherte Tweet-IDs gebündelt holen
+            tweet_ids = list({str(tweet.get('id')) for tweet in tweets})
+            existing = await self._select_in('news_content', 'metadata', 'metadata->>tweet_id', tweet_ids)
+            seen_ids = {
+                str((row.get('metadata') or {}).get('tweet_id'))
+                for row in existing
+            }
+            
+            created_at = datetime.utcnow().isoformat()
+            rows = []
             
             for tweet in tweets:
-                # Prüfen ob Tweet bereits existiert
-                existing = self.client.table('news_content').select('id').eq('metadata->>tweet_id', tweet.get('id')).execute()
+                tweet_id = str(tweet.get('id'))
+                if tweet_id in seen_ids:
+                    continue
+                seen_ids.add(tweet_id)
                 
-                if not existing.data:
-                    # Tweet für Supabase vorbereiten
-                    tweet_data = {
-                        'title': f"@{tweet.get('author_username')}: {tweet.get('text', '')[:100]}...",
-                        'summary': tweet.get('text', ''),
-                        'source': f"twitter_{tweet.get('author_username')}",
-                        'category': tweet.get('category', 'bitcoin'),
-                        'priority': tweet.get('priority', 5),
-                        'published_at': tweet.get('created_at', datetime.utcnow()).isoformat(),
-                        'content_type': 'x_tweet',
-                        'metadata': {
-                            'tweet_id': tweet.get('id'),
-                            'author_username': tweet.get('author_username'),
-                            'author_name': tweet.get('author_name'),
-                            'like_count': tweet.get('like_count', 0),
-                            'retweet_count': tweet.get('retweet_count', 0),
-                            'url': tweet.get('url', ''),
-                            'tags': tweet.get('tags', [])
-                        },
-                        'created_at': datetime.utcnow().isoformat()
-                    }
-                    
-                    result = self.client.table('news_content').insert(tweet_data).execute()
-                    
-                    if result.data:
-                        saved_count += 1
+                # Tweet für Supabase vorbereiten
+                rows.append({
+                    'title': f"@{tweet.get('author_username')}: {tweet.get('text', '')[:100]}...",
+                    'summary': tweet.get('text', ''),
+                    'source': f"twitter_{tweet.get('author_username')}",
+                    'category': tweet.get('category', 'bitcoin'),
+                    'priority': tweet.get('priority', 5),
+                    'published_at': tweet.get('created_at', datetime.utcnow()).isoformat(),
+                    'content_type': 'x_tweet',
+                    'metadata': {
+                        'tweet_id': tweet.get('id'),
+                        'author_username': tweet.get('author_username'),
+                        'author_name': tweet.get('author_name'),
+                        'like_count': tweet.get('like_count', 0),
+                        'retweet_count': tweet.get('retweet_count', 0),
+                        'url': tweet.get('url', ''),
+                        'tags': tweet.get('tags', [])
+                    },
+                    'created_at': created_at
+                })
+            
+            saved_count = 0
+            if rows:
+                # Ein Roundtrip für alle neuen Tweets statt einem Insert pro Tweet
+                result = await asyncio.to_thread(
+                    self.client.table('news_content').insert(rows).execute
+                )
+                saved_count = len(result.data) if result.data else 0
             
             logger.info(f"✅ {saved_count} Tweets in Supabase gespeichert")
             return saved_count
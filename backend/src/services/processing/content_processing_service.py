@@ -103,7 +103,7 @@ class ContentProcessingService:
                 "generated_by": "GPT-4"
             }
             
-            logger.info(f"✅ Radioshow erstellt: {len(radio_show.get('selected_news', []))} News")
+            logger.info("✅ Radioshow erstellt: {} News", len(radio_show.get('selected_news', [])))
             return result
             
         except Exception as e:
@@ -125,7 +125,7 @@ class ContentProcessingService:
             Dict mit vollständiger Show-Konfiguration
         """
         
-        logger.info(f"🎭 Lade Show-Konfiguration für: {preset_name}")
+        logger.info("🎭 Lade Show-Konfiguration für: {}", preset_name)
         
         try:
             # Verwende die get_show_for_generation Funktion
@@ -135,7 +135,7 @@ class ContentProcessingService:
                 logger.error(f"❌ Show-Konfiguration für '{preset_name}' nicht gefunden")
                 return None
             
-            logger.info(f"✅ Show-Konfiguration geladen: {show_config['show']['display_name']}")
+            logger.info("✅ Show-Konfiguration geladen: {}", show_config['show']['display_name'])
             return show_config
             
         except Exception as e:
@@ -188,7 +188,7 @@ class ContentProcessingService:
         # GPT-4 hat 8192 Token Limit, Input + Output muss < 8192 sein
         if len(news_articles) > 10:
             news_articles = news_articles[:10]
-            logger.info(f"🔧 News auf 10 reduziert für GPT Token-Limit")
+            logger.info("🔧 News auf 10 reduziert für GPT Token-Limit")
         
         # Kürze auch die Summaries um Token zu sparen
         for article in news_articles:
@@ -225,7 +225,11 @@ class ContentProcessingService:
                 "show_behavior": show_config["show"].get("show_behavior", {})
             }
         
-        logger.info(f"📊 Daten für GPT vorbereitet: {len(news_articles)} News, Show: {show_config['show']['display_name'] if show_config else 'Default'}")
+        logger.info(
+            "📊 Daten für GPT vorbereitet: {} News, Show: {}",
+            len(news_articles),
+            show_config['show']['display_name'] if show_config else 'Default'
+        )
         
         return prepared
     
@@ -18,18 +18,22 @@ ARCHITEKTUR:
 
 import asyncio
 import json
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 from dataclasses import dataclass, asdict
 import hashlib
 
+# Schneller nicht-kryptographischer Hash für Duplikat-Erkennung (in requirements.txt)
+import xxhash
+
 # Supabase statt SQLite
-from .supabase_service import SupabaseService
+from ..infrastructure.supabase_service import SupabaseService
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsEntry:
     """Einzelner News-Artikel"""
     session_id: str
@@ -69,8 +73,8 @@ class ContentLoggingService:
     """
     
     def __init__(self):
-        # Supabase Service
-        self.supabase = SupabaseService()
+        # Supabase Service (lazy - erst beim ersten DB-Zugriff)
+        self._supabase = None
         
         # Logging-Verzeichnisse (für JSON-Backups)
         self.logs_dir = Path("logs/content")
@@ -88,6 +92,13 @@ class ContentLoggingService:
             "archive_threshold_days": 7
         }
     
+    @property
+    def supabase(self) -> SupabaseService:
+        """Lazy loading of Supabase service"""
+        if self._supabase is None:
+            self._supabase = SupabaseService()
+        return self._supabase
+    
     async def log_collected_news(
         self,
         session_id: str,
@@ -115,6 +126,9 @@ class ContentLoggingService:
             news_entries = []
             selected_urls = {news.get("url", "") for news in selected_news}
             
+            # Ein gemeinsamer Zeitstempel für den ganzen Batch statt isoformat() pro Artikel
+            logged_at = datetime.now().isoformat()
+            
             for news_item in collected_news:
                 # Content-Hash für Duplikat-Erkennung
                 content_hash = self._generate_content_hash(news_item) if self.config["enable_content_hashing"] else ""
@@ -126,7 +140,7 @@ class ContentLoggingService:
                     summary=news_item.get("summary", ""),
                     url=news_item.get("url", ""),
                     category=news_item.get("primary_category", "general"),
-                    timestamp=datetime.now().isoformat(),
+                    timestamp=logged_at,
                     content_hash=content_hash,
                     selected_for_broadcast=news_item.get("url", "") in selected_urls,
                     priority_score=news_item.get("priority_score", 0.0)
@@ -134,14 +148,18 @@ class ContentLoggingService:
                 
                 news_entries.append(news_entry)
             
+            # Einmal zählen, von allen Schritten wiederverwendet
+            selected_count = sum(1 for n in news_entries if n.selected_for_broadcast)
+            
             # 2. In Datenbank speichern
-            await self._save_news_entries(news_entries)
+            await self._save_news_entries(news_entries, selected_count)
             
             # 3. JSON-Log erstellen
             json_log_path = await self._create_news_json_log(
                 session_id, 
                 news_entries, 
-                collection_metadata
+                collection_metadata,
+                selected_count
             )
             
             # 4. Duplikat-Analyse (falls aktiviert)
@@ -153,7 +171,7 @@ class ContentLoggingService:
                 "success": True,
                 "session_id": session_id,
                 "total_news_logged": len(news_entries),
-                "selected_for_broadcast": len([n for n in news_entries if n.selected_for_broadcast]),
+                "selected_for_broadcast": selected_count,
                 "json_log_path": str(json_log_path),
                 "duplicate_analysis": duplicate_analysis,
                 "timestamp": datetime.now().isoformat()
@@ -193,7 +211,7 @@ class ContentLoggingService:
         
         try:
             # Script-Hash für Integrität
-            script_hash = hashlib.sha256(script_content.encode()).hexdigest()[:16]
+            script_hash = hashlib.blake2b(script_content.encode(), digest_size=8).hexdigest()
             
             # Word Count und Duration schätzen
             word_count = len(script_content.split())
@@ -365,9 +383,13 @@ class ContentLoggingService:
         
         # Relevante Felder für Hash
         hash_content = f"{content.get('title', '')}{content.get('summary', '')}{content.get('url', '')}"
-        return hashlib.sha256(hash_content.encode()).hexdigest()[:16]
+        
+        # xxh3 (64 Bit) reicht als Duplikat-Schlüssel; 16 Hex-Zeichen wie der
+        # frühere gekürzte SHA-256. Immer xxh3, damit der Hash nicht von der
+        # Installation abhängt.
+        return xxhash.xxh3_64_hexdigest(hash_content)
     
-    async def _save_news_entries(self, news_entries: List[NewsEntry]):
+    async def _save_news_entries(self, news_entries: List[NewsEntry], selected_count: int):
         """Speichert News-Einträge als JSON-Backup und in broadcast_logs"""
         
         try:
@@ -377,7 +399,7 @@ class ContentLoggingService:
                 "session_id": session_id,
                 "news_entries": [asdict(entry) for entry in news_entries],
                 "total_count": len(news_entries),
-                "selected_count": len([e for e in news_entries if e.selected_for_broadcast]),
+                "selected_count": selected_count,
                 "timestamp": datetime.now().isoformat()
             }
             
@@ -392,14 +414,17 @@ class ContentLoggingService:
                     "event_type": "news_collected",
                     "event_data": {
                         "total_news": len(news_entries),
-                        "selected_news": len([e for e in news_entries if e.selected_for_broadcast]),
+                        "selected_news": selected_count,
                         "categories": list(set(e.category for e in news_entries)),
                         "sources": list(set(e.source for e in news_entries))
                     },
                     "timestamp": datetime.now().isoformat()
                 }
                 
-                response = self.supabase.client.table('broadcast_logs').insert(log_entry).execute()
+                # Supabase Client ist synchron → Roundtrip im Thread statt im Event Loop
+                response = await asyncio.to_thread(
+                    self.supabase.client.table('broadcast_logs').insert(log_entry).execute
+                )
                 if response.data:
                     logger.info(f"✅ News-Summary in broadcast_logs gespeichert")
                     
@@ -442,7 +467,9 @@ class ContentLoggingService:
                     "created_at": script_entry.generation_timestamp
                 }
                 
-                response = self.supabase.client.table('broadcast_scripts').insert(broadcast_entry).execute()
+                response = await asyncio.to_thread(
+                    self.supabase.client.table('broadcast_scripts').insert(broadcast_entry).execute
+                )
                 if response.data:
                     logger.info(f"✅ Script in broadcast_scripts gespeichert")
                     
@@ -459,7 +486,8 @@ class ContentLoggingService:
         self, 
         session_id: str, 
         news_entries: List[NewsEntry], 
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        selected_count: int
     ) -> Path:
         """Erstellt JSON-Log für News"""
         
@@ -468,7 +496,7 @@ class ContentLoggingService:
             "timestamp": datetime.now().isoformat(),
             "metadata": metadata,
             "total_news": len(news_entries),
-            "selected_news": len([n for n in news_entries if n.selected_for_broadcast]),
+            "selected_news": selected_count,
             "news_entries": [asdict(entry) for entry in news_entries]
         }
         
@@ -500,10 +528,8 @@ class ContentLoggingService:
     async def _analyze_duplicates(self, news_entries: List[NewsEntry]) -> Dict[str, Any]:
         """Analysiert Duplikate"""
         
-        hash_counts = {}
-        for entry in news_entries:
-            if entry.content_hash:
-                hash_counts[entry.content_hash] = hash_counts.get(entry.content_hash, 0) + 1
+        # Counter zählt in C; str-Hashes sind im String-Objekt gecacht
+        hash_counts = Counter(entry.content_hash for entry in news_entries if entry.content_hash)
         
         duplicates = {h: count for h, count in hash_counts.items() if count > 1}
         
@@ -537,12 +563,12 @@ class ContentLoggingService:
             
             # 2. Zusätzlich aus broadcast_logs holen
             try:
-                response = self.supabase.client.table('broadcast_logs')\
+                query = self.supabase.client.table('broadcast_logs')\
                     .select('*')\
                     .eq('event_type', 'news_collected')\
                     .gte('timestamp', start_date)\
-                    .lte('timestamp', end_date)\
-                    .execute()
+                    .lte('timestamp', end_date)
+                response = await asyncio.to_thread(query.execute)
                 
                 if response.data:
                     logger.info(f"✅ {len(response.data)} News-Logs aus Supabase geladen")
@@ -604,12 +630,12 @@ class ContentLoggingService:
             
             # 2. Zusätzlich aus broadcast_scripts holen
             try:
-                response = self.supabase.client.table('broadcast_scripts')\
+                query = self.supabase.client.table('broadcast_scripts')\
                     .select('*')\
                     .eq('broadcast_style', 'content_logged')\
                     .gte('created_at', start_date)\
-                    .lte('created_at', end_date)\
-                    .execute()
+                    .lte('created_at', end_date)
+                response = await asyncio.to_thread(query.execute)
                 
                 if response.data:
                     logger.info(f"✅ {len(response.data)} Script-Logs aus Supabase geladen")
@@ -629,19 +655,18 @@ class ContentLoggingService:
         news_data: List[Dict[str, Any]], 
         script_data: List[Dict[str, Any]], 
         start_date: str, 
-        end_date: str
+        end_date: str,
+        categories: Optional[Counter] = None
     ) -> Dict[str, Any]:
-        """Generiert Summary-Report"""
+        """Generiert Summary-Report (optional mit bereits gezählten Kategorien)"""
         
         # News-Statistiken
         total_news = len(news_data)
-        selected_news = len([n for n in news_data if n.get('selected_for_broadcast')])
+        selected_news = sum(1 for n in news_data if n.get('selected_for_broadcast'))
         
-        # Kategorien-Verteilung
-        categories = {}
-        for news in news_data:
-            cat = news.get('category', 'unknown')
-            categories[cat] = categories.get(cat, 0) + 1
+        # Kategorien-Verteilung (nur zählen, wenn der Aufrufer sie nicht mitliefert)
+        if categories is None:
+            categories = Counter(news.get('category', 'unknown') for news in news_data)
         
         # Script-Statistiken
         total_scripts = len(script_data)
@@ -654,7 +679,7 @@ class ContentLoggingService:
                 "total_collected": total_news,
                 "selected_for_broadcast": selected_news,
                 "selection_rate": round(selected_news / total_news * 100, 1) if total_news > 0 else 0,
-                "categories": categories
+                "categories": dict(categories)
             },
             "script_stats": {
                 "total_scripts": total_scripts,
@@ -707,14 +732,11 @@ class ContentLoggingService:
     ) -> Dict[str, Any]:
         """Generiert Analytics-Report"""
         
-        summary = await self._generate_summary_report(news_data, script_data, start_date, end_date)
-        
-        # Erweiterte Analytics
-        # Source-Analyse
-        sources = {}
-        for news in news_data:
-            source = news.get('source', 'unknown')
-            sources[source] = sources.get(source, 0) + 1
+        # Kategorien + Quellen in einem Durchlauf zählen und wiederverwenden
+        categories, sources = self._tally_news(news_data)
+        summary = await self._generate_summary_report(
+            news_data, script_data, start_date, end_date, categories=categories
+        )
         
         # Priority-Score Analyse
         priority_scores = [n.get('priority_score', 0) for n in news_data if n.get('priority_score')]
@@ -731,15 +753,27 @@ class ContentLoggingService:
         summary.update({
             "report_type": "analytics",
             "analytics": {
-                "source_distribution": sources,
+                "source_distribution": dict(sources),
                 "avg_priority_score": round(avg_priority, 2),
                 "hourly_distribution": hourly_distribution,
-                "top_categories": dict(sorted(summary["news_stats"]["categories"].items(), key=lambda x: x[1], reverse=True)[:5])
+                "top_categories": dict(categories.most_common(5))
             }
         })
         
         return summary
     
+    def _tally_news(self, news_data: List[Dict[str, Any]]) -> Tuple[Counter, Counter]:
+        """Zählt Kategorien und Quellen in einem einzigen Durchlauf"""
+        
+        categories = Counter()
+        sources = Counter()
+        
+        for news in news_data:
+            categories[news.get('category', 'unknown')] += 1
+            sources[news.get('source', 'unknown')] += 1
+        
+        return categories, sources
+    
     async def _save_report(self, report: Dict[str, Any], report_type: str) -> Path:
         """Speichert Report als JSON"""
         
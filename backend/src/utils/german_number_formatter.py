@@ -9,6 +9,62 @@ import re
 from typing import Dict, List
 
 
+# Vorkompilierte Patterns (einmal pro Modul statt re-Cache-Lookup pro Aufruf)
+_BITCOIN_RE = re.compile(r'\$([0-9,]+)\.([0-9]+)')
+_EURO_RE = re.compile(r'€([0-9,]+)\.([0-9]+)')
+_CHF_RE = re.compile(r'CHF\s*([0-9,]+)\.([0-9]+)')
+_PERCENT_RE = re.compile(r'([+-]?)([0-9]+)\.([0-9]+)%')
+_TEMP_RE = re.compile(r'([0-9]+)\.([0-9]+)°C')
+_DECIMAL_RE = re.compile(r'([0-9]+)\.([0-9]+)')
+_YEAR_RE = re.compile(r'\b(19|20)([0-9]{2})\b')
+_TIME_RE = re.compile(r'\b([0-9]{1,2}):([0-9]{2})\b')
+_LARGE_NUMBER_RE = re.compile(r'\b([0-9]{1,3}(?:,[0-9]{3})+)\b')
+_SIMPLE_NUMBER_RE = re.compile(r'\b([0-9]+)\b')
+_ORDINAL_RE = re.compile(r'\b([0-9]+)\.\b')
+
+# Häufige Abkürzungen und ihre ausgeschriebene Form
+_ABBREVIATIONS = {
+    "z.B.": "zum Beispiel",
+    "d.h.": "das heißt",
+    "u.a.": "unter anderem",
+    "etc.": "et cetera",
+    "bzw.": "beziehungsweise",
+    "ca.": "circa",
+    "inkl.": "inklusive",
+    "exkl.": "exklusive",
+    "ggf.": "gegebenenfalls",
+    "evtl.": "eventuell",
+    "max.": "maximal",
+    "min.": "minimal",
+    "Nr.": "Nummer",
+    "Tel.": "Telefon",
+    "Str.": "Straße",
+    "Dr.": "Doktor",
+    "Prof.": "Professor",
+    "CHF": "Schweizer Franken",
+    "USD": "US-Dollar",
+    "EUR": "Euro",
+    "BTC": "Bitcoin",
+    "AI": "Künstliche Intelligenz",
+    "KI": "Künstliche Intelligenz",
+    "CEO": "Chief Executive Officer",
+    "CFO": "Chief Financial Officer",
+    "CTO": "Chief Technology Officer",
+    "API": "Application Programming Interface",
+    "URL": "Uniform Resource Locator",
+    "HTML": "HyperText Markup Language",
+    "CSS": "Cascading Style Sheets",
+    "JS": "JavaScript",
+    "SQL": "Structured Query Language"
+}
+
+# Wortgrenzen-Patterns pro Abkürzung, in Einfügereihenfolge
+_ABBREVIATION_PATTERNS = tuple(
+    (re.compile(r'\b' + re.escape(abbrev) + r'\b', re.IGNORECASE), full_form)
+    for abbrev, full_form in _ABBREVIATIONS.items()
+)
+
+
 class GermanNumberFormatter:
     """Formatiert Zahlen für optimale deutsche Aussprache in ElevenLabs"""
     
@@ -122,28 +178,22 @@ class GermanNumberFormatter:
         """Formatiert Dezimalzahlen für deutsche Aussprache"""
         
         # Bitcoin-Preise (z.B. $45,123.67)
-        bitcoin_pattern = r'\$([0-9,]+)\.([0-9]+)'
-        text = re.sub(bitcoin_pattern, lambda m: self._format_currency_amount(m.group(1), m.group(2), "Dollar"), text)
+        text = _BITCOIN_RE.sub(lambda m: self._format_currency_amount(m.group(1), m.group(2), "Dollar"), text)
         
         # Euro-Preise (z.B. €1,234.56)
-        euro_pattern = r'€([0-9,]+)\.([0-9]+)'
-        text = re.sub(euro_pattern, lambda m: self._format_currency_amount(m.group(1), m.group(2), "Euro"), text)
+        text = _EURO_RE.sub(lambda m: self._format_currency_amount(m.group(1), m.group(2), "Euro"), text)
         
         # Schweizer Franken
-        chf_pattern = r'CHF\s*([0-9,]+)\.([0-9]+)'
-        text = re.sub(chf_pattern, lambda m: self._format_currency_amount(m.group(1), m.group(2), "Schweizer Franken"), text)
+        text = _CHF_RE.sub(lambda m: self._format_currency_amount(m.group(1), m.group(2), "Schweizer Franken"), text)
         
         # Prozentangaben (z.B. +2.5%, -1.3%)
-        percent_pattern = r'([+-]?)([0-9]+)\.([0-9]+)%'
-        text = re.sub(percent_pattern, self._format_percentage, text)
+        text = _PERCENT_RE.sub(self._format_percentage, text)
         
         # Temperaturen (z.B. 15.5°C)
-        temp_pattern = r'([0-9]+)\.([0-9]+)°C'
-        text = re.sub(temp_pattern, self._format_temperature, text)
+        text = _TEMP_RE.sub(self._format_temperature, text)
         
         # Allgemeine Dezimalzahlen (z.B. 3.14)
-        decimal_pattern = r'([0-9]+)\.([0-9]+)'
-        text = re.sub(decimal_pattern, self._format_general_decimal, text)
+        text = _DECIMAL_RE.sub(self._format_general_decimal, text)
         
         return text
     
@@ -220,20 +270,16 @@ class GermanNumberFormatter:
         """Formatiert ganze Zahlen für deutsche Aussprache"""
         
         # Jahre (z.B. 2024)
-        year_pattern = r'\b(19|20)([0-9]{2})\b'
-        text = re.sub(year_pattern, self._format_year, text)
+        text = _YEAR_RE.sub(self._format_year, text)
         
         # Uhrzeiten (z.B. 7:00, 08:30)
-        time_pattern = r'\b([0-9]{1,2}):([0-9]{2})\b'
-        text = re.sub(time_pattern, self._format_time, text)
+        text = _TIME_RE.sub(self._format_time, text)
         
         # Große Zahlen mit Kommas (z.B. 1,234,567)
-        large_number_pattern = r'\b([0-9]{1,3}(?:,[0-9]{3})+)\b'
-        text = re.sub(large_number_pattern, self._format_large_number, text)
+        text = _LARGE_NUMBER_RE.sub(self._format_large_number, text)
         
         # Einfache ganze Zahlen (z.B. 42)
-        simple_number_pattern = r'\b([0-9]+)\b'
-        text = re.sub(simple_number_pattern, self._format_simple_number, text)
+        text = _SIMPLE_NUMBER_RE.sub(self._format_simple_number, text)
         
         return text
     
@@ -296,8 +342,7 @@ class GermanNumberFormatter:
         """Formatiert Ordinalzahlen"""
         
         # Ordinalzahlen mit Punkt (z.B. 1., 2., 3.)
-        ordinal_pattern = r'\b([0-9]+)\.\b'
-        text = re.sub(ordinal_pattern, self._format_ordinal, text)
+        text = _ORDINAL_RE.sub(self._format_ordinal, text)
         
         return text
     
@@ -341,45 +386,9 @@ class GermanNumberFormatter:
     def format_abbreviations(self, text: str) -> str:
         """Formatiert häufige Abkürzungen für deutsche Aussprache"""
         
-        abbreviations = {
-            "z.B.": "zum Beispiel",
-            "d.h.": "das heißt",
-            "u.a.": "unter anderem",
-            "etc.": "et cetera",
-            "bzw.": "beziehungsweise",
-            "ca.": "circa",
-            "inkl.": "inklusive",
-            "exkl.": "exklusive",
-            "ggf.": "gegebenenfalls",
-            "evtl.": "eventuell",
-            "max.": "maximal",
-            "min.": "minimal",
-            "Nr.": "Nummer",
-            "Tel.": "Telefon",
-            "Str.": "Straße",
-            "Dr.": "Doktor",
-            "Prof.": "Professor",
-            "CHF": "Schweizer Franken",
-            "USD": "US-Dollar",
-            "EUR": "Euro",
-            "BTC": "Bitcoin",
-            "AI": "Künstliche Intelligenz",
-            "KI": "Künstliche Intelligenz",
-            "CEO": "Chief Executive Officer",
-            "CFO": "Chief Financial Officer",
-            "CTO": "Chief Technology Officer",
-            "API": "Application Programming Interface",
-            "URL": "Uniform Resource Locator",
-            "HTML": "HyperText Markup Language",
-            "CSS": "Cascading Style Sheets",
-            "JS": "JavaScript",
-            "SQL": "Structured Query Language"
-        }
-        
-        for abbrev, full_form in abbreviations.items():
+        for pattern, full_form in _ABBREVIATION_PATTERNS:
             # Verwende Wortgrenzen für präzise Ersetzung
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-            text = re.sub(pattern, full_form, text, flags=re.IGNORECASE)
+            text = pattern.sub(full_form, text)
         
         return text
 